@@ -0,0 +1,75 @@
+import argparse
+import asyncio
+import json
+import time
+
+from email_server import LatencyStats
+from task1 import generate_sample_emails
+
+
+async def run_client(host: str, port: int, emails: list, batch_size: int,
+                     stats: LatencyStats):
+    """Send emails over one persistent connection in pipelined batches."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for i in range(0, len(emails), batch_size):
+            batch = emails[i:i + batch_size]
+            started = time.perf_counter()
+            writer.write(("\n".join(batch) + "\n").encode())
+            await writer.drain()
+            for _ in batch:
+                await reader.readline()
+            stats.record(time.perf_counter() - started, len(batch))
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def fetch_server_stats(host: str, port: int) -> dict:
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b"!stats\n")
+    await writer.drain()
+    line = await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+    return json.loads(line)
+
+
+async def run_load(host: str, port: int, connections: int, per_connection: int,
+                   batch_size: int):
+    emails = generate_sample_emails(per_connection)
+    stats = LatencyStats()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(run_client(host, port, emails, batch_size, stats)
+                           for _ in range(connections)))
+    elapsed = time.perf_counter() - started
+
+    total = connections * per_connection
+    print(f"Email Server Load Test ({connections:,} connections, "
+          f"{per_connection:,} addresses each, batch size {batch_size})")
+    print("=" * 70)
+    print(f"Elapsed: {elapsed:.3f}s | Throughput: {total / elapsed:,.0f} addr/s")
+    print(f"Client round-trip latency (ms): {stats.percentiles()}")
+    print(f"Server stats: {await fetch_server_stats(host, port)}")
+    print("=" * 70)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for email_server.py.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("-c", "--connections", type=int, default=1000)
+    parser.add_argument("-n", "--per-connection", type=int, default=100)
+    parser.add_argument("-b", "--batch-size", type=int, default=10)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    asyncio.run(run_load(args.host, args.port, args.connections,
+                         args.per_connection, args.batch_size))
+
+
+if __name__ == "__main__":
+    main()
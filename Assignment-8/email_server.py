@@ -0,0 +1,169 @@
+import argparse
+import asyncio
+import collections
+import json
+import time
+import unittest
+
+from task1 import validate_emails
+
+
+class LatencyStats:
+    """Keep a bounded window of request latencies and report percentiles."""
+
+    def __init__(self, window: int = 100_000):
+        self._samples = collections.deque(maxlen=window)
+        self.requests = 0
+        self.addresses = 0
+
+    def record(self, seconds: float, addresses: int) -> None:
+        self._samples.append(seconds)
+        self.requests += 1
+        self.addresses += addresses
+
+    def percentiles(self, points=(50, 90, 99, 99.9)) -> dict:
+        """Return the requested latency percentiles in milliseconds."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {f"p{p}": 0.0 for p in points}
+        last = len(samples) - 1
+        return {f"p{p}": samples[round(last * p / 100)] * 1000 for p in points}
+
+    def snapshot(self) -> dict:
+        return {
+            "requests": self.requests,
+            "addresses": self.addresses,
+            "latency_ms": self.percentiles(),
+        }
+
+
+class EmailValidationServer:
+    """
+    Line-protocol email validation server on a single asyncio event loop.
+
+    Each newline-terminated address gets a "1" (valid) or "0" (invalid)
+    reply line, in order. Clients may pipeline any number of addresses
+    without waiting; every read is validated as one batch with
+    validate_emails, which gives the same verdicts as is_valid_email.
+    The line "!stats" returns a JSON line with latency percentiles.
+    A client whose unterminated line grows past max_line bytes gets a
+    "!error line too long" reply and is disconnected.
+    """
+
+    STATS_COMMAND = "!stats"
+    LINE_TOO_LONG = b"!error line too long\n"
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8025,
+                 read_size: int = 1 << 16, max_line: int = 4096):
+        self.host = host
+        self.port = port
+        self.read_size = read_size
+        self.max_line = max_line
+        self.stats = LatencyStats()
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, backlog=4096)
+        return self._server
+
+    async def serve_forever(self):
+        server = await self.start()
+        async with server:
+            await server.serve_forever()
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter):
+        pending = b""
+        try:
+            while True:
+                data = await reader.read(self.read_size)
+                if not data:
+                    break
+
+                started = time.perf_counter()
+                pending += data
+                end = pending.rfind(b"\n")
+                if end != -1:
+                    lines = pending[:end].decode("utf-8", errors="replace").split("\n")
+                    pending = pending[end + 1:]
+
+                    writer.write(self._respond(lines))
+                    await writer.drain()
+                    self.stats.record(time.perf_counter() - started, len(lines))
+
+                # Bound the unterminated tail so one client cannot buffer without limit
+                if len(pending) > self.max_line:
+                    writer.write(self.LINE_TOO_LONG)
+                    await writer.drain()
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, lines: list) -> bytes:
+        emails = [line.rstrip("\r") for line in lines]
+        if self.STATS_COMMAND not in emails:
+            return "".join(["1\n" if ok else "0\n"
+                            for ok in validate_emails(emails)]).encode()
+
+        out = []
+        for email in emails:
+            if email == self.STATS_COMMAND:
+                out.append(json.dumps(self.stats.snapshot()) + "\n")
+            else:
+                out.append("1\n" if validate_emails([email])[0] else "0\n")
+        return "".join(out).encode()
+
+
+class TestEmailValidationServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = EmailValidationServer(port=0, read_size=64, max_line=100)
+        listener = await self.server.start()
+        self.addAsyncCleanup(listener.wait_closed)
+        self.addCleanup(listener.close)
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def test_replies_in_order(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"user@example.com\ninvalid\r\n!stats\n")
+        await writer.drain()
+        self.assertEqual(await reader.readline(), b"1\n")
+        self.assertEqual(await reader.readline(), b"0\n")
+        self.assertIn("latency_ms", json.loads(await reader.readline()))
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_overlong_line_disconnects(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"user@example.com\n" + b"x" * 1000)
+        await writer.drain()
+        self.assertEqual(await reader.readline(), b"1\n")
+        self.assertEqual(await reader.readline(), EmailValidationServer.LINE_TOO_LONG)
+        self.assertEqual(await reader.read(), b"")
+        writer.close()
+        await writer.wait_closed()
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Email validation server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--max-line", type=int, default=4096,
+                        help="disconnect clients whose line exceeds this many bytes")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = EmailValidationServer(args.host, args.port, max_line=args.max_line)
+    print(f"Serving email validation on {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats.snapshot()))
+
+
+if __name__ == "__main__":
+    main()
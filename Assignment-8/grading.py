@@ -0,0 +1,534 @@
+# Keep imports minimal: this module is loaded by short-lived batch workers,
+# so annotations stay unevaluated and csv/array/numpy load on first use.
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+
+GRADE_CUTOFFS = (60, 70, 80, 90)
+GRADE_LETTERS = b"FDCBA"
+
+
+class GradingScale:
+    """
+    A grading scale compiled into a sorted cutoff table.
+    cutoffs is an iterable of (minimum score, grade) pairs; scores below the
+    lowest cutoff get the lowest grade. Grading is a bisect over the cutoffs
+    (O(log k)), or a direct table lookup for integer scores (O(1)).
+    Raises TypeError for non-numeric scores and ValueError for scores
+    outside minimum-maximum, like assign_grade.
+    """
+
+    def __init__(self, cutoffs, lowest: str = "F",
+                 minimum: int | float = 0, maximum: int | float = 100):
+        pairs = sorted(cutoffs)
+        bounds = tuple(bound for bound, _ in pairs)
+        if len(set(bounds)) != len(bounds):
+            raise ValueError("Cutoffs must be distinct")
+        if bounds and (bounds[0] <= minimum or bounds[-1] > maximum):
+            raise ValueError("Cutoffs must lie above the minimum and within the maximum")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self._bounds = bounds
+        self._grades = (lowest,) + tuple(grade for _, grade in pairs)
+        self._range_error = f"Score must be between {minimum} and {maximum} inclusive"
+
+        # O(1) lookup table for integer scores on integer-bounded scales
+        if isinstance(minimum, int) and isinstance(maximum, int) and maximum - minimum <= 10_000:
+            self._int_table = tuple(self._grades[bisect_right(bounds, s)]
+                                    for s in range(minimum, maximum + 1))
+        else:
+            self._int_table = None
+
+    def __repr__(self):
+        cutoffs = list(zip(self._bounds, self._grades[1:]))
+        return f"GradingScale({cutoffs!r}, lowest={self._grades[0]!r})"
+
+    def grade(self, score: int | float) -> str:
+        if not isinstance(score, (int, float)):
+            raise TypeError("Score must be a number")
+        if score < self.minimum or score > self.maximum:
+            raise ValueError(self._range_error)
+
+        if self._int_table is not None and score.__class__ is int:
+            return self._int_table[score - self.minimum]
+        if score != score:
+            # NaN passes the range check and gets the lowest grade
+            return self._grades[0]
+        return self._grades[bisect_right(self._bounds, score)]
+
+    __call__ = grade
+
+
+_SCALE_CACHE = {}
+
+
+def grading_scale(cutoffs: tuple, lowest: str = "F",
+                  minimum: int | float = 0,
+                  maximum: int | float = 100) -> GradingScale:
+    """Return a cached GradingScale for a hashable tuple of (cutoff, grade) pairs."""
+    key = (cutoffs, lowest, minimum, maximum)
+    scale = _SCALE_CACHE.get(key)
+    if scale is None:
+        scale = _SCALE_CACHE[key] = GradingScale(cutoffs, lowest, minimum, maximum)
+    return scale
+
+
+DEFAULT_SCALE = GradingScale(zip(GRADE_CUTOFFS, "DCBA"), lowest="F")
+
+PLUS_MINUS_SCALE = GradingScale([
+    (60, "D-"), (63, "D"), (67, "D+"),
+    (70, "C-"), (73, "C"), (77, "C+"),
+    (80, "B-"), (83, "B"), (87, "B+"),
+    (90, "A-"), (93, "A"), (97, "A+"),
+], lowest="F")
+
+PASS_FAIL_SCALE = GradingScale([(60, "P")], lowest="F")
+
+
+def assign_grade(score: int | float) -> str:
+    """
+    Assign a letter grade based on numeric score.
+    Rules:
+      90-100 -> 'A'
+      80-89  -> 'B'
+      70-79  -> 'C'
+      60-69  -> 'D'
+      <60    -> 'F'
+    Accepts int or float. Raises TypeError for non-numeric inputs and
+    ValueError for scores outside 0-100.
+    """
+    return DEFAULT_SCALE.grade(score)
+
+# Byte-to-grade table for uint8 buffers; 0 marks scores above 100
+_UINT8_GRADES = bytes(GRADE_LETTERS[bisect_right(GRADE_CUTOFFS, s)] if s <= 100 else 0
+                      for s in range(256))
+
+
+def _score_error(exc_type, message: str, indices: list) -> Exception:
+    """Build a TypeError/ValueError that lists and carries the offending indices."""
+    shown = ", ".join(str(i) for i in indices[:10])
+    more = f", ... ({len(indices)} total)" if len(indices) > 10 else ""
+    err = exc_type(f"{message} (offending indices: {shown}{more})")
+    err.indices = indices
+    return err
+
+
+def assign_grades(scores) -> bytes:
+    """
+    Assign letter grades to many scores at once.
+    Accepts a NumPy array, array.array, bytes-like buffer or any iterable of
+    numbers and returns one ASCII grade letter per score, e.g. b"ABF".
+    Uses searchsorted over GRADE_CUTOFFS when NumPy is installed, and a
+    lookup table or bisect otherwise. Raises TypeError or ValueError like
+    assign_grade; the exception's indices attribute lists offending positions.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is not None and isinstance(scores, np.ndarray):
+        view = None
+        values = scores
+    else:
+        try:
+            view = memoryview(scores)
+        except TypeError:
+            # ranges, deques, generators and other non-buffer iterables
+            view = None
+            if not isinstance(scores, (list, tuple)):
+                scores = list(scores)
+        values = None if np is None or view is None else np.asarray(view)
+
+    if values is not None:
+        if values.dtype.kind in "biuf":
+            return _assign_grades_numpy(np, values.ravel())
+        scores = values.ravel().tolist()
+        view = None
+
+    if view is not None and view.ndim == 1:
+        if view.format == "B":
+            grades = bytes(view).translate(_UINT8_GRADES)
+            if 0 in grades:
+                bad = [i for i, g in enumerate(grades) if g == 0]
+                raise _score_error(ValueError, "Score must be between 0 and 100 inclusive", bad)
+            return grades
+        if view.format in "bhHiIlLqQfd":
+            return _assign_grades_buffer(view)
+
+    return _assign_grades_python(scores if view is None else view.tolist())
+
+
+def _assign_grades_numpy(np, values) -> bytes:
+    if values.dtype.kind == "f":
+        # NaN passes the scalar range check and grades as "F"
+        nan = np.isnan(values)
+        bad = np.flatnonzero(~nan & ((values < 0) | (values > 100)))
+    else:
+        nan = None
+        bad = np.flatnonzero((values < 0) | (values > 100))
+    if bad.size:
+        raise _score_error(ValueError, "Score must be between 0 and 100 inclusive", bad.tolist())
+
+    codes = np.searchsorted(np.array(GRADE_CUTOFFS), values, side="right")
+    if nan is not None:
+        codes[nan] = 0
+    return np.frombuffer(GRADE_LETTERS, dtype=np.uint8)[codes].tobytes()
+
+
+def _assign_grades_buffer(view) -> bytes:
+    # Typed buffers only hold numbers, so a NaN-free buffer within 0-100
+    # can be graded by table lookup on the integer part of each score
+    total = sum(view)
+    if total != total or \
+            (len(view) and (min(view) < 0 or max(view) > 100)):
+        return _assign_grades_python(view.tolist())
+    return bytes(map(_UINT8_GRADES.__getitem__, map(int, view)))
+
+
+def _assign_grades_python(scores) -> bytes:
+    grades = bytearray(len(scores))
+    bad_type = []
+    bad_range = []
+    for i, score in enumerate(scores):
+        try:
+            grades[i] = ord(assign_grade(score))
+        except TypeError:
+            bad_type.append(i)
+        except ValueError:
+            bad_range.append(i)
+
+    if bad_type:
+        raise _score_error(TypeError, "Score must be a number", bad_type)
+    if bad_range:
+        raise _score_error(ValueError, "Score must be between 0 and 100 inclusive", bad_range)
+    return bytes(grades)
+
+
+class GradeStats:
+    """
+    Running per-grade counts and score statistics in O(1) memory.
+    Scores are also counted in 101 one-point histogram buckets (0-100), so
+    percentiles come from the histogram without keeping the scores.
+    Partial results from separate workers combine with merge(), and
+    to_dict()/from_dict() give a JSON-friendly serialized form.
+    """
+
+    BUCKETS = 101
+
+    def __init__(self):
+        self.counts = {}
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+        self.rejected = 0
+        self.histogram = [0] * self.BUCKETS
+
+    def add(self, score: int | float, grade: str) -> None:
+        if not isinstance(score, int) and not math.isfinite(score):
+            # NaN and inf have no histogram bucket and would poison mean and variance
+            raise TypeError("Score must be a finite number")
+        self.counts[grade] = self.counts.get(grade, 0) + 1
+        self.count += 1
+        # Welford's update keeps mean and variance stable in one pass
+        delta = score - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (score - self.mean)
+        if self.minimum is None or score < self.minimum:
+            self.minimum = score
+        if self.maximum is None or score > self.maximum:
+            self.maximum = score
+        bucket = int(score)
+        self.histogram[0 if bucket < 0 else min(bucket, self.BUCKETS - 1)] += 1
+
+    def add_score(self, score: int | float, scale: GradingScale = DEFAULT_SCALE) -> str:
+        """Grade a score with scale, record it and return the grade. NaN and inf raise TypeError."""
+        grade = scale.grade(score)
+        self.add(score, grade)
+        return grade
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> int:
+        """Return the histogram bucket (whole score) holding the p-th percentile."""
+        if not 0 <= p <= 100:
+            raise ValueError("Percentile must be between 0 and 100 inclusive")
+        if not self.count:
+            raise ValueError("No scores recorded")
+        rank = max(1, -(-self.count * p // 100))
+        seen = 0
+        for bucket, n in enumerate(self.histogram):
+            seen += n
+            if seen >= rank:
+                return bucket
+        return self.BUCKETS - 1
+
+    def merge(self, other: GradeStats) -> GradeStats:
+        """Fold another partial result into this one and return self."""
+        if not other.count:
+            self.rejected += other.rejected
+            return self
+        if not self.count:
+            self.mean = other.mean
+            self._m2 = other._m2
+        else:
+            # Chan et al. pairwise combination of mean and sum of squares
+            total = self.count + other.count
+            delta = other.mean - self.mean
+            self.mean += delta * other.count / total
+            self._m2 += other._m2 + delta * delta * self.count * other.count / total
+        self.count += other.count
+        self.rejected += other.rejected
+        for grade, n in other.counts.items():
+            self.counts[grade] = self.counts.get(grade, 0) + n
+        if self.minimum is None or other.minimum < self.minimum:
+            self.minimum = other.minimum
+        if self.maximum is None or other.maximum > self.maximum:
+            self.maximum = other.maximum
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "counts": dict(self.counts),
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self._m2,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+            "rejected": self.rejected,
+            "histogram": list(self.histogram),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> GradeStats:
+        stats = cls()
+        stats.counts = dict(data["counts"])
+        stats.count = data["count"]
+        stats.mean = data["mean"]
+        stats._m2 = data["m2"]
+        stats.minimum = data["minimum"]
+        stats.maximum = data["maximum"]
+        stats.rejected = data["rejected"]
+        stats.histogram = list(data["histogram"])
+        return stats
+
+
+def _parse_score(text: str) -> int | float:
+    """Parse a CSV score field, raising TypeError like assign_grade for non-numbers."""
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        score = float(text)
+    except ValueError:
+        raise TypeError("Score must be a number") from None
+    if score != score:
+        raise TypeError("Score must be a number")
+    return score
+
+
+def grade_csv(infile, outfile, rejects=None, score_column: str = "score",
+              grade_column: str = "grade", delimiter: str = ",",
+              scale: GradingScale = DEFAULT_SCALE) -> GradeStats:
+    """
+    Stream a CSV/TSV gradebook, appending a grade column to each row.
+    Rows are read and written one at a time, so memory use does not grow
+    with the file. Rows whose score is not a number or is out of range, or
+    whose field count does not match the header, are written to rejects
+    with an error column after the header's columns (any extra fields
+    follow it) instead of stopping the run. Raises ValueError if the header
+    lacks score_column or already has grade_column (or "error", when
+    rejects is given). Returns the GradeStats for the graded rows.
+    """
+    import csv
+
+    reader = csv.DictReader(infile, delimiter=delimiter)
+    fieldnames = reader.fieldnames
+    if fieldnames is None or score_column not in fieldnames:
+        raise ValueError(f"Missing score column: {score_column}")
+    if grade_column in fieldnames:
+        raise ValueError(f"Header already has a {grade_column} column")
+
+    writer = csv.DictWriter(outfile, fieldnames + [grade_column],
+                            delimiter=delimiter, lineterminator="\n")
+    writer.writeheader()
+    reject_writer = None
+    if rejects is not None:
+        if "error" in fieldnames:
+            raise ValueError("Header already has an error column")
+        reject_writer = csv.writer(rejects, delimiter=delimiter, lineterminator="\n")
+        reject_writer.writerow(fieldnames + ["error"])
+
+    stats = GradeStats()
+    grade = scale.grade
+    width = len(fieldnames)
+    for row in reader:
+        # DictReader files extra fields under None and fills missing ones with None
+        extra = row.pop(None, None)
+        try:
+            if extra is not None:
+                raise ValueError(f"Row has more than {width} fields")
+            if None in row.values():
+                raise ValueError(f"Row has fewer than {width} fields")
+            score = _parse_score(row[score_column])
+            row[grade_column] = grade(score)
+        except (TypeError, ValueError) as e:
+            stats.rejected += 1
+            if reject_writer is not None:
+                reject_writer.writerow([row[name] for name in fieldnames] + [str(e)] +
+                                       (extra or []))
+            continue
+        stats.add(score, row[grade_column])
+        writer.writerow(row)
+
+    return stats
+
+
+REJECTED_CODE = ord("-")
+
+
+def _grade_gradebook_file(task: tuple) -> tuple:
+    """Pool worker: grade one gradebook file and return compact results."""
+    import csv
+
+    path, score_column, delimiter = task
+    codes = bytearray()
+    stats = GradeStats()
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None or score_column not in header:
+            raise ValueError(f"Missing score column in {path}: {score_column}")
+        column = header.index(score_column)
+        width = len(header)
+
+        grade = DEFAULT_SCALE.grade
+        for row in reader:
+            if not row:
+                # Skip blank lines, as csv.DictReader does in grade_csv
+                continue
+            if len(row) != width:
+                # Ragged rows are rejected, as in grade_csv
+                stats.rejected += 1
+                codes.append(REJECTED_CODE)
+                continue
+            try:
+                score = _parse_score(row[column])
+                letter = grade(score)
+            except (TypeError, ValueError):
+                stats.rejected += 1
+                codes.append(REJECTED_CODE)
+                continue
+            stats.add(score, letter)
+            codes.append(ord(letter))
+
+    return path, bytes(codes), stats.to_dict()
+
+
+def grade_gradebooks(paths, workers: int = None, score_column: str = "score",
+                     delimiter: str = ","):
+    """
+    Grade many gradebook files across a pool of worker processes.
+    Each worker grades whole files with the assign_grade rules and returns
+    one grade letter per data row as bytes ("-" for rejected rows) plus a
+    serialized GradeStats; the parent merges the stats. workers=1 grades
+    in-process without a pool.
+    Returns (list of (path, grade_codes) in input order, merged GradeStats).
+    """
+    tasks = [(path, score_column, delimiter) for path in paths]
+    if workers == 1:
+        results = map(_grade_gradebook_file, tasks)
+        return _merge_gradebook_results(results)
+
+    import multiprocessing
+
+    with multiprocessing.Pool(workers) as pool:
+        return _merge_gradebook_results(pool.imap(_grade_gradebook_file, tasks))
+
+
+def _merge_gradebook_results(results) -> tuple:
+    codes = []
+    stats = GradeStats()
+    for path, grades, partial in results:
+        codes.append((path, grades))
+        stats.merge(GradeStats.from_dict(partial))
+    return codes, stats
+
+
+def run_grade_benchmark(count: int = 1_000_000, repeat: int = 3):
+    """Compare a scalar assign_grade loop against assign_grades."""
+    import random
+    import timeit
+    from array import array
+
+    rng = random.Random(0)
+    scores = array("d", (rng.uniform(0, 100) for _ in range(count)))
+
+    scalar = min(timeit.repeat(
+        lambda: [assign_grade(s) for s in scores], number=1, repeat=repeat))
+    bulk = min(timeit.repeat(
+        lambda: assign_grades(scores), number=1, repeat=repeat))
+
+    print(f"assign_grade loop: {scalar:.3f}s")
+    print(f"assign_grades:     {bulk:.3f}s ({scalar / bulk:.1f}x)")
+
+
+def run_gradebook_benchmark(files: int = 16, rows: int = 50_000, max_workers: int = None):
+    """Report grade_gradebooks throughput from 1 to max_workers processes."""
+    import os
+    import random
+    import tempfile
+    import time
+
+    max_workers = max_workers or os.cpu_count() or 1
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(files):
+            path = os.path.join(tmp, f"gradebook{i}.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("student,score\n")
+                f.writelines(f"s{n},{rng.uniform(0, 100):.2f}\n" for n in range(rows))
+            paths.append(path)
+
+        total = files * rows
+        baseline = None
+        for workers in range(1, max_workers + 1):
+            started = time.perf_counter()
+            grade_gradebooks(paths, workers)
+            elapsed = time.perf_counter() - started
+            baseline = baseline or elapsed
+            print(f"workers={workers}: {total / elapsed:,.0f} rows/s "
+                  f"({baseline / elapsed:.2f}x)")
+
+
+def run_import_benchmark(modules=("grading", "unittest", "task2", "task4"), repeat: int = 5):
+    """
+    Report the cumulative `python -X importtime` cost of each module.
+    task2 and task4 define TestCase classes, so unittest is their floor;
+    batch workers should import grading directly.
+    """
+    import os
+    import subprocess
+    import sys
+
+    here = os.path.dirname(os.path.abspath(__file__))
+    for module in modules:
+        best = None
+        for _ in range(repeat):
+            result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                                    capture_output=True, text=True, cwd=here)
+            for line in result.stderr.splitlines():
+                fields = [field.strip() for field in line.split("|")]
+                if len(fields) == 3 and fields[2] == module:
+                    micros = int(fields[1])
+                    best = micros if best is None else min(best, micros)
+        print(f"import {module}: {best / 1000:.1f} ms")
@@ -1,3 +1,13 @@
+import argparse
+import collections
+import functools
+import mmap
+import multiprocessing
+import os
+import re
+import sys
+
+
 def is_valid_email(email: str) -> bool:
     """
     Validate email address based on specific requirements:
@@ -57,62 +67,410 @@ def is_valid_email(email: str) -> bool:
     return True
 
 
+def validate_emails(emails) -> list:
+    """
+    Validate many email addresses in one pass over the input.
+
+    Applies exactly the same rules as is_valid_email, but works on index
+    positions (find/rfind) instead of building split() lists, so no
+    per-address list or substring allocations are needed.
+
+    Args:
+        emails (iterable): Email addresses to validate
+
+    Returns:
+        list: One bool per address, in input order
+    """
+    results = []
+    append = results.append
+    specials = '.-_'
+
+    for email in emails:
+        if not email or not isinstance(email, str):
+            append(False)
+            continue
+
+        email = email.strip()
+        at = email.find('@')
+
+        # Exactly one @ with non-empty local and domain parts
+        if at <= 0 or at == len(email) - 1 or email.find('@', at + 1) != -1:
+            append(False)
+            continue
+
+        # Local part and domain part edges
+        if (email[0] in specials or email[at - 1] in specials
+                or email[at + 1] in specials or email[-1] in specials):
+            append(False)
+            continue
+
+        # Domain needs a dot, no empty labels and a TLD of 2+ characters
+        last_dot = email.rfind('.', at + 1)
+        if (last_dot == -1 or len(email) - last_dot < 3
+                or email.find('..', at + 1) != -1):
+            append(False)
+            continue
+
+        append(True)
+
+    return results
+
+
+def stream_validate(infile, outfile, rejects_only: bool = False,
+                    chunk_size: int = 1 << 20) -> tuple:
+    """
+    Validate newline-delimited addresses from infile and write results to outfile.
+
+    Lines are read in chunks of roughly chunk_size bytes, so memory use stays
+    constant no matter how large the input is. Each chunk is checked with
+    validate_emails, which gives the same verdicts as is_valid_email
+    (enforced by test_email_validation.py).
+
+    Args:
+        infile: Text file object to read addresses from
+        outfile: Text file object to write results to
+        rejects_only (bool): Write only the rejected addresses
+        chunk_size (int): Approximate number of bytes to read per chunk
+
+    Returns:
+        tuple: (valid_count, invalid_count)
+    """
+    valid_count = 0
+    invalid_count = 0
+
+    while True:
+        lines = infile.readlines(chunk_size)
+        if not lines:
+            break
+
+        emails = [line.rstrip('\r\n') for line in lines]
+        chunk_valid, chunk_invalid, out = _format_results(emails, rejects_only)
+        outfile.write(out)
+        valid_count += chunk_valid
+        invalid_count += chunk_invalid
+
+    return valid_count, invalid_count
+
+
+def _format_results(emails: list, rejects_only: bool) -> tuple:
+    """Validate a chunk of addresses and render its output lines."""
+    verdicts = validate_emails(emails)
+
+    if rejects_only:
+        out = [email for email, ok in zip(emails, verdicts) if not ok]
+    else:
+        out = [f"{email}\t{'valid' if ok else 'invalid'}"
+               for email, ok in zip(emails, verdicts)]
+
+    valid = sum(verdicts)
+    text = '\n'.join(out) + '\n' if out else ''
+    return valid, len(verdicts) - valid, text
+
+
+def _byte_ranges(path: str, chunk_bytes: int) -> list:
+    """Split a file into (start, end) byte ranges that end on a newline."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    ranges = []
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b'\n', start + chunk_bytes)
+            end = size if newline == -1 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _validate_range(task: tuple) -> tuple:
+    """Pool worker: validate the addresses in one memory-mapped byte range."""
+    path, start, end, rejects_only = task
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode('utf-8')
+
+    # Match the universal-newline splitting used by stream_validate
+    emails = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+    if emails[-1] == '':
+        emails.pop()
+    return _format_results(emails, rejects_only)
+
+
+def parallel_validate(path: str, workers: int = None, rejects_only: bool = False,
+                      chunk_bytes: int = 1 << 22):
+    """
+    Validate an address file across a pool of worker processes.
+
+    The file is split into newline-aligned byte ranges; workers memory-map
+    the file and read their own range, so only (path, start, end) tuples
+    are sent to them. Results come back as rendered text batches.
+
+    Args:
+        path (str): File of newline-delimited addresses
+        workers (int): Number of worker processes (default: CPU count)
+        rejects_only (bool): Render only the rejected addresses
+        chunk_bytes (int): Approximate size of each byte range
+
+    Yields:
+        tuple: (valid_count, invalid_count, output_text) per range, in file order
+    """
+    tasks = [(path, start, end, rejects_only)
+             for start, end in _byte_ranges(path, chunk_bytes)]
+    if not tasks:
+        return
+
+    with multiprocessing.Pool(workers) as pool:
+        yield from pool.imap(_validate_range, tasks)
+
+
+def _check_domain(domain: str) -> bool:
+    """Apply the is_valid_email domain-part rules to a single domain."""
+    if not domain or domain[0] in '.-_' or domain[-1] in '.-_':
+        return False
+    last_dot = domain.rfind('.')
+    return last_dot != -1 and len(domain) - last_dot > 2 and '..' not in domain
+
+
+_cached_check_domain = functools.lru_cache(maxsize=1024)(_check_domain)
+
+
+def configure_domain_cache(maxsize: int = 1024) -> None:
+    """
+    Replace the domain verdict cache with an empty one of the given size.
+
+    Args:
+        maxsize (int): Maximum number of domains to remember (None for unbounded)
+    """
+    global _cached_check_domain
+    _cached_check_domain = functools.lru_cache(maxsize=maxsize)(_check_domain)
+
+
+def domain_cache_info():
+    """Return the hits, misses, maxsize and currsize of the domain cache."""
+    return _cached_check_domain.cache_info()
+
+
+def is_valid_email_cached(email: str) -> bool:
+    """
+    Validate an email address like is_valid_email, memoizing domain verdicts.
+
+    The local part is checked on every call; the domain part verdict comes
+    from a bounded LRU cache, so repeated domains cost a single lookup.
+
+    Args:
+        email (str): Email address to validate
+
+    Returns:
+        bool: True if email is valid, False otherwise
+    """
+    if not email or not isinstance(email, str):
+        return False
+
+    email = email.strip()
+    at = email.find('@')
+
+    # Exactly one @ and a non-empty local part without special edges
+    if at <= 0 or email.find('@', at + 1) != -1:
+        return False
+    if email[0] in '.-_' or email[at - 1] in '.-_':
+        return False
+
+    return _cached_check_domain(email[at + 1:])
+
+
+# Single-pass pattern for the is_valid_email rules: local part without
+# special edges, one @, then dot-separated non-empty domain labels with no
+# special edges and a TLD of at least 2 characters.
+_EMAIL_PATTERN = re.compile(
+    r'[^@.\-_](?:[^@]*[^@.\-_])?'
+    r'@[^@.\-_][^@.]*(?:\.[^@.]+)*\.[^@.]+[^@.\-_]'
+)
+
+
+def is_valid_email_regex(email: str) -> bool:
+    """
+    Validate an email address like is_valid_email using one precompiled regex.
+
+    The whole address is checked in a single left-to-right match instead of
+    separate count/split scans.
+
+    Args:
+        email (str): Email address to validate
+
+    Returns:
+        bool: True if email is valid, False otherwise
+    """
+    if not email or not isinstance(email, str):
+        return False
+    return _EMAIL_PATTERN.fullmatch(email.strip()) is not None
+
+
+# Rejection reason codes returned by email_rejection_reason
+VALID = 'VALID'
+NOT_STRING = 'NOT_STRING'
+EMPTY = 'EMPTY'
+MISSING_AT = 'MISSING_AT'
+MULTIPLE_AT = 'MULTIPLE_AT'
+MISSING_DOT = 'MISSING_DOT'
+EMPTY_LOCAL = 'EMPTY_LOCAL'
+EMPTY_DOMAIN = 'EMPTY_DOMAIN'
+BAD_LOCAL_EDGE = 'BAD_LOCAL_EDGE'
+BAD_DOMAIN_EDGE = 'BAD_DOMAIN_EDGE'
+EMPTY_LABEL = 'EMPTY_LABEL'
+SHORT_TLD = 'SHORT_TLD'
+
+
+def email_rejection_reason(email: str) -> str:
+    """
+    Validate an email address and return why it was rejected.
+
+    The rules are checked in the same order as is_valid_email, so the first
+    failing rule is reported and VALID means is_valid_email returns True.
+
+    Args:
+        email (str): Email address to validate
+
+    Returns:
+        str: VALID or one of the rejection reason codes
+    """
+    if not isinstance(email, str):
+        return NOT_STRING
+
+    email = email.strip()
+    if not email:
+        return EMPTY
+
+    at = email.find('@')
+    if at == -1:
+        return MISSING_AT
+    if email.find('@', at + 1) != -1:
+        return MULTIPLE_AT
+    if '.' not in email:
+        return MISSING_DOT
+    if at == 0:
+        return EMPTY_LOCAL
+    if at == len(email) - 1:
+        return EMPTY_DOMAIN
+    if email[0] in '.-_' or email[at - 1] in '.-_':
+        return BAD_LOCAL_EDGE
+    if email[at + 1] in '.-_' or email[-1] in '.-_':
+        return BAD_DOMAIN_EDGE
+
+    last_dot = email.rfind('.', at + 1)
+    if last_dot == -1:
+        return MISSING_DOT
+    if email.find('..', at + 1) != -1:
+        return EMPTY_LABEL
+    if len(email) - last_dot < 3:
+        return SHORT_TLD
+    return VALID
+
+
+def classify_emails(emails) -> tuple:
+    """
+    Validate many addresses and count rejection reasons in the same pass.
+
+    Args:
+        emails (iterable): Email addresses to validate
+
+    Returns:
+        tuple: (list of bool verdicts, collections.Counter of reason codes)
+    """
+    reasons = [email_rejection_reason(email) for email in emails]
+    return [reason == VALID for reason in reasons], collections.Counter(reasons)
+
+
+BACKENDS = {
+    'rules': is_valid_email,
+    'cached': is_valid_email_cached,
+    'regex': is_valid_email_regex,
+}
+
+_default_backend = 'rules'
+
+
+def set_default_backend(name: str) -> None:
+    """Select the backend used by check_email when none is given."""
+    global _default_backend
+    if name not in BACKENDS:
+        raise ValueError(f"unknown backend: {name}")
+    _default_backend = name
+
+
+def check_email(email: str, backend: str = None) -> bool:
+    """
+    Validate an email address with the chosen backend.
+
+    Args:
+        email (str): Email address to validate
+        backend (str): One of BACKENDS (default: the global default backend)
+
+    Returns:
+        bool: True if email is valid, False otherwise
+    """
+    return BACKENDS[backend or _default_backend](email)
+
+
+TEST_CASES = [
+    # Valid emails
+    ("john@example.com", True, "Standard valid email"),
+    ("user.name@domain.co.uk", True, "Email with dot in local part"),
+    ("test123@test.org", True, "Email with numbers"),
+    ("a@b.co", True, "Minimal valid email"),
+    
+    # Invalid - Missing @ symbol
+    ("johnexample.com", False, "Missing @ symbol"),
+    
+    # Invalid - Missing dot
+    ("john@example", False, "Missing dot in domain"),
+    
+    # Invalid - Multiple @ symbols
+    ("john@@example.com", False, "Multiple @ symbols"),
+    ("john@doe@example.com", False, "Multiple @ symbols (2)"),
+    
+    # Invalid - Starts with special character
+    (".john@example.com", False, "Starts with dot"),
+    ("-john@example.com", False, "Starts with hyphen"),
+    ("_john@example.com", False, "Starts with underscore"),
+    
+    # Invalid - Ends with special character
+    ("john.@example.com", False, "Local part ends with dot"),
+    ("john-@example.com", False, "Local part ends with hyphen"),
+    ("john_@example.com", False, "Local part ends with underscore"),
+    
+    # Invalid - Domain issues
+    ("john@.example.com", False, "Domain starts with dot"),
+    ("john@example.com.", False, "Domain ends with dot"),
+    ("john@example..com", False, "Domain has consecutive dots"),
+    ("john@-example.com", False, "Domain starts with hyphen"),
+    ("john@example-.com", False, "Domain ends with hyphen"),
+    
+    # Invalid - Empty parts
+    ("@example.com", False, "Missing local part"),
+    ("john@", False, "Missing domain part"),
+    ("", False, "Empty string"),
+    
+    # Invalid - TLD too short
+    ("john@example.c", False, "TLD with only 1 character"),
+    
+    # Invalid - Special characters
+    ("john#doe@example.com", False, "Special character in local part"),
+    ("john@exam ple.com", False, "Space in domain"),
+]
+
+
 def run_test_cases():
     """Run comprehensive test cases for email validator."""
-    test_cases = [
-        # Valid emails
-        ("john@example.com", True, "Standard valid email"),
-        ("user.name@domain.co.uk", True, "Email with dot in local part"),
-        ("test123@test.org", True, "Email with numbers"),
-        ("a@b.co", True, "Minimal valid email"),
-        
-        # Invalid - Missing @ symbol
-        ("johnexample.com", False, "Missing @ symbol"),
-        
-        # Invalid - Missing dot
-        ("john@example", False, "Missing dot in domain"),
-        
-        # Invalid - Multiple @ symbols
-        ("john@@example.com", False, "Multiple @ symbols"),
-        ("john@doe@example.com", False, "Multiple @ symbols (2)"),
-        
-        # Invalid - Starts with special character
-        (".john@example.com", False, "Starts with dot"),
-        ("-john@example.com", False, "Starts with hyphen"),
-        ("_john@example.com", False, "Starts with underscore"),
-        
-        # Invalid - Ends with special character
-        ("john.@example.com", False, "Local part ends with dot"),
-        ("john-@example.com", False, "Local part ends with hyphen"),
-        ("john_@example.com", False, "Local part ends with underscore"),
-        
-        # Invalid - Domain issues
-        ("john@.example.com", False, "Domain starts with dot"),
-        ("john@example.com.", False, "Domain ends with dot"),
-        ("john@example..com", False, "Domain has consecutive dots"),
-        ("john@-example.com", False, "Domain starts with hyphen"),
-        ("john@example-.com", False, "Domain ends with hyphen"),
-        
-        # Invalid - Empty parts
-        ("@example.com", False, "Missing local part"),
-        ("john@", False, "Missing domain part"),
-        ("", False, "Empty string"),
-        
-        # Invalid - TLD too short
-        ("john@example.c", False, "TLD with only 1 character"),
-        
-        # Invalid - Special characters
-        ("john#doe@example.com", False, "Special character in local part"),
-        ("john@exam ple.com", False, "Space in domain"),
-    ]
-    
     print("Email Validator Test Cases")
     print("=" * 70)
     
     passed = 0
     failed = 0
     
-    for email, expected, description in test_cases:
+    for email, expected, description in TEST_CASES:
         result = is_valid_email(email)
         status = "✓ PASS" if result == expected else "✗ FAIL"
         
@@ -126,7 +484,135 @@ def run_test_cases():
             print(f"       Expected: {expected}, Got: {result}")
     
     print("=" * 70)
-    print(f"Total: {len(test_cases)} | Passed: {passed} | Failed: {failed}")
+    print(f"Total: {len(TEST_CASES)} | Passed: {passed} | Failed: {failed}")
+
+
+def run_differential_tests(fuzz_count: int = 100_000, seed: int = 0):
+    """Check that every backend agrees with is_valid_email on TEST_CASES and fuzzed input."""
+    import random
+
+    rng = random.Random(seed)
+    alphabet = 'ab1.@-_ #\t\xa0é'
+    inputs = [email for email, _, _ in TEST_CASES] + [None, 42, ' a@b.co ']
+    inputs += [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+               for _ in range(fuzz_count)]
+    expected = [is_valid_email(email) for email in inputs]
+
+    print("Backend Differential Tests")
+    print("=" * 70)
+
+    failed = 0
+    for name, backend in BACKENDS.items():
+        mismatches = [email for email, want in zip(inputs, expected)
+                      if backend(email) != want]
+        status = "✓ PASS" if not mismatches else "✗ FAIL"
+        print(f"{status} | {name:10} | {len(inputs):,} inputs | {len(mismatches)} mismatches")
+        for email in mismatches[:5]:
+            print(f"       Mismatch: {email!r}")
+        failed += bool(mismatches)
+
+    reasons = classify_emails(inputs)[0]
+    mismatches = [email for email, ok, want in zip(inputs, reasons, expected)
+                  if ok != want]
+    status = "✓ PASS" if not mismatches else "✗ FAIL"
+    print(f"{status} | {'reasons':10} | {len(inputs):,} inputs | {len(mismatches)} mismatches")
+    for email in mismatches[:5]:
+        print(f"       Mismatch: {email!r}")
+    failed += bool(mismatches)
+
+    print("=" * 70)
+    print(f"Backends: {len(BACKENDS) + 1} | Passed: {len(BACKENDS) + 1 - failed} | Failed: {failed}")
+
+
+def generate_sample_emails(count: int, seed: int = 0) -> list:
+    """Build a reproducible mix of valid and invalid addresses for benchmarks."""
+    import random
+
+    rng = random.Random(seed)
+    templates = [
+        "user{n}@example.com",
+        "first.last{n}@mail.domain.co.uk",
+        "user{n}@gmail.com",
+        "user{n}@@example.com",
+        ".user{n}@example.com",
+        "user{n}@example..com",
+        "user{n}@example.c",
+        "user{n}example.com",
+    ]
+    return [rng.choice(templates).format(n=i) for i in range(count)]
+
+
+def run_benchmark(count: int = 200_000, repeat: int = 3):
+    """Compare the per-call is_valid_email loop against validate_emails."""
+    import timeit
+
+    emails = generate_sample_emails(count)
+
+    per_call = min(timeit.repeat(
+        lambda: [is_valid_email(e) for e in emails], number=1, repeat=repeat))
+    batch = min(timeit.repeat(
+        lambda: validate_emails(emails), number=1, repeat=repeat))
+
+    same = validate_emails(emails) == [is_valid_email(e) for e in emails]
+
+    print(f"Email Validator Benchmark ({count:,} addresses)")
+    print("=" * 70)
+    print(f"{'is_valid_email loop':30} | {per_call:8.3f}s | {count / per_call:12,.0f} addr/s")
+    print(f"{'validate_emails':30} | {batch:8.3f}s | {count / batch:12,.0f} addr/s")
+    print("=" * 70)
+    print(f"Speedup: {per_call / batch:.2f}x | Same verdicts: {'Yes' if same else 'No'}")
+
+
+def generate_zipf_emails(count: int, domains: int = 500, exponent: float = 1.1,
+                         seed: int = 0) -> list:
+    """Build addresses whose domains follow a Zipf distribution."""
+    import random
+
+    rng = random.Random(seed)
+    names = [f"domain{k}.com" for k in range(1, domains + 1)]
+    weights = [1 / k ** exponent for k in range(1, domains + 1)]
+    picked = rng.choices(names, weights=weights, k=count)
+    return [f"user{i}@{domain}" for i, domain in enumerate(picked)]
+
+
+def run_cache_benchmark(count: int = 200_000, repeat: int = 3):
+    """Compare is_valid_email against is_valid_email_cached on Zipf data."""
+    import timeit
+
+    emails = generate_zipf_emails(count)
+
+    plain = min(timeit.repeat(
+        lambda: [is_valid_email(e) for e in emails], number=1, repeat=repeat))
+    configure_domain_cache()
+    cached = min(timeit.repeat(
+        lambda: [is_valid_email_cached(e) for e in emails], number=1, repeat=repeat))
+    info = domain_cache_info()
+
+    same = [is_valid_email_cached(e) for e in emails] == [is_valid_email(e) for e in emails]
+    hit_rate = info.hits / (info.hits + info.misses)
+
+    print(f"Domain Cache Benchmark ({count:,} Zipf-distributed addresses)")
+    print("=" * 70)
+    print(f"{'is_valid_email loop':30} | {plain:8.3f}s | {count / plain:12,.0f} addr/s")
+    print(f"{'is_valid_email_cached loop':30} | {cached:8.3f}s | {count / cached:12,.0f} addr/s")
+    print("=" * 70)
+    print(f"Speedup: {plain / cached:.2f}x | Hit rate: {hit_rate:.1%} | "
+          f"Same verdicts: {'Yes' if same else 'No'}")
+
+
+def run_backend_benchmark(count: int = 200_000, repeat: int = 3):
+    """Report the per-address latency of each validation backend."""
+    import timeit
+
+    emails = generate_sample_emails(count)
+
+    print(f"Backend Latency Benchmark ({count:,} addresses)")
+    print("=" * 70)
+    for name, backend in BACKENDS.items():
+        elapsed = min(timeit.repeat(
+            lambda: [backend(e) for e in emails], number=1, repeat=repeat))
+        print(f"{name:30} | {elapsed * 1e9 / count:8.1f} ns/address")
+    print("=" * 70)
 
 
 def get_user_input() -> str:
@@ -138,19 +624,76 @@ def get_user_input() -> str:
         print("Please enter a non-empty email.")
 
 
-def main():
+def parse_args(argv=None):
+    """Parse command-line options for the non-interactive streaming mode."""
+    parser = argparse.ArgumentParser(
+        description="Validate newline-delimited email addresses.")
+    parser.add_argument("input", nargs="?",
+                        help="File to read addresses from ('-' for stdin)")
+    parser.add_argument("-o", "--output", default="-",
+                        help="File to write results to (default: stdout)")
+    parser.add_argument("--rejects-only", action="store_true",
+                        help="Only write addresses that fail validation")
+    parser.add_argument("--buffer-size", type=int, default=1 << 20,
+                        help="I/O buffer and chunk size in bytes")
+    parser.add_argument("-j", "--workers", type=int, default=1,
+                        help="Number of worker processes for file input")
+    args = parser.parse_args(argv)
+    if args.workers > 1 and args.input == "-":
+        parser.error("--workers needs a file input, not stdin")
+    return args
+
+
+def run_stream(args) -> int:
+    """Run streaming or parallel validation using the options from parse_args."""
+    size = args.buffer_size
+    outfile = (sys.stdout if args.output == "-"
+               else open(args.output, "w", encoding="utf-8", buffering=size))
+    try:
+        if args.workers > 1:
+            valid = invalid = 0
+            for chunk_valid, chunk_invalid, out in parallel_validate(
+                    args.input, args.workers, args.rejects_only):
+                outfile.write(out)
+                valid += chunk_valid
+                invalid += chunk_invalid
+        else:
+            infile = (sys.stdin if args.input == "-"
+                      else open(args.input, encoding="utf-8", buffering=size))
+            try:
+                valid, invalid = stream_validate(infile, outfile,
+                                                 rejects_only=args.rejects_only,
+                                                 chunk_size=size)
+            finally:
+                if infile is not sys.stdin:
+                    infile.close()
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    print(f"Valid: {valid} | Invalid: {invalid}", file=sys.stderr)
+    return 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.input:
+        return run_stream(args)
+
     print("Email Validator Application\n")
     
     while True:
         print("\nOptions:")
         print("1. Run test cases")
         print("2. Validate custom email")
-        print("3. Exit")
+        print("3. Run benchmark")
+        print("4. Exit")
         
-        choice = input("Choose an option (1-3): ").strip()
+        choice = input("Choose an option (1-4): ").strip()
         
         if choice == '1':
             run_test_cases()
+            run_differential_tests()
         
         elif choice == '2':
             email = get_user_input()
@@ -159,6 +702,11 @@ def main():
             print(f"Valid: {'Yes ✓' if is_valid else 'No ✗'}")
         
         elif choice == '3':
+            run_benchmark()
+            run_cache_benchmark()
+            run_backend_benchmark()
+        
+        elif choice == '4':
             print("Goodbye!")
             break
         
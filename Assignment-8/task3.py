@@ -1,3 +1,7 @@
+import codecs
+import mmap
+import os
+import tempfile
 import unittest
 
 def is_sentence_palindrome(sentence: str) -> bool:
@@ -12,6 +16,312 @@ def is_sentence_palindrome(sentence: str) -> bool:
     return cleaned == cleaned[::-1]
 
 
+def is_sentence_palindrome_two_pointer(sentence: str, block_size: int = 1 << 12) -> bool:
+    """
+    Two-pointer version of is_sentence_palindrome.
+
+    Walks inward from both ends, stopping at the first mismatch, with
+    O(block_size) extra memory. ASCII text is cleaned and compared a block
+    at a time with bytes.translate, which is faster than
+    is_sentence_palindrome even on a full scan. Other text is walked one
+    character at a time: about 1.5x slower than is_sentence_palindrome on a
+    full scan, but it still stops at the first mismatch. Characters
+    whose lowercase form is more than one code point (such as 'İ') fall
+    back to is_sentence_palindrome so results always agree.
+    """
+    if not isinstance(sentence, str):
+        raise TypeError("Input must be a string")
+    if sentence.isascii():
+        return _ascii_two_pointer(sentence, block_size)
+
+    i = 0
+    j = len(sentence) - 1
+    while i < j:
+        left = sentence[i]
+        if not left.isalnum():
+            i += 1
+            continue
+        right = sentence[j]
+        if not right.isalnum():
+            j -= 1
+            continue
+
+        left = left.lower()
+        right = right.lower()
+        if len(left) != 1 or len(right) != 1:
+            return is_sentence_palindrome(sentence)
+        if left != right:
+            return False
+        i += 1
+        j -= 1
+
+    # A lone middle character could still lower to several code points
+    if i == j and len(sentence[i].lower()) != 1 and sentence[i].isalnum():
+        return is_sentence_palindrome(sentence)
+    return True
+
+
+# ASCII fast path tables: lowercase letters and drop everything that is not
+# an ASCII letter or digit (the same characters str.isalnum keeps in ASCII)
+_ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", b"abcdefghijklmnopqrstuvwxyz")
+_ASCII_NON_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
+
+
+def _ascii_two_pointer(sentence: str, block_size: int) -> bool:
+    """Compare cleaned blocks read forward from the start and backward from the end."""
+    i = 0
+    j = len(sentence)
+    left = right = b""
+    while True:
+        if not left and i < j:
+            end = min(i + block_size, j)
+            left = sentence[i:end].encode().translate(_ASCII_LOWER, _ASCII_NON_ALNUM)
+            i = end
+        elif not right and i < j:
+            start = max(j - block_size, i)
+            right = sentence[start:j].encode().translate(_ASCII_LOWER, _ASCII_NON_ALNUM)[::-1]
+            j = start
+        elif left and right:
+            n = min(len(left), len(right))
+            if left[:n] != right[:n]:
+                return False
+            left = left[n:]
+            right = right[n:]
+        else:
+            # Everything is read; the unmatched middle must mirror itself
+            rest = left or right
+            return rest == rest[::-1]
+
+
+def are_sentence_palindromes(sentences) -> list:
+    """
+    Batch version of is_sentence_palindrome.
+
+    ASCII strings are normalized with one bytes.translate call using
+    precomputed tables; other strings fall back to is_sentence_palindrome.
+    Returns one bool per input and raises TypeError for non-strings.
+    """
+    results = []
+    append = results.append
+    lower = _ASCII_LOWER
+    drop = _ASCII_NON_ALNUM
+    for sentence in sentences:
+        if sentence.__class__ is str and sentence.isascii():
+            cleaned = sentence.encode("ascii").translate(lower, drop)
+            append(cleaned == cleaned[::-1])
+        else:
+            append(is_sentence_palindrome(sentence))
+    return results
+
+
+def _forward_chars(mm, block_size: int):
+    """Yield the normalized characters of a UTF-8 buffer from the start."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(mm), block_size):
+        for char in decoder.decode(mm[start:start + block_size]):
+            if char.isalnum():
+                yield from char.lower()
+    decoder.decode(b"", final=True)
+
+
+def _backward_chars(mm, block_size: int):
+    """Yield the normalized characters of a UTF-8 buffer from the end, reversed."""
+    end = len(mm)
+    while end > 0:
+        start = max(0, end - block_size)
+        # Back up to a lead byte so no multi-byte character is split
+        while start > 0 and mm[start] & 0xC0 == 0x80:
+            start -= 1
+        for char in reversed(mm[start:end].decode("utf-8")):
+            if char.isalnum():
+                yield from reversed(char.lower())
+        end = start
+
+
+def is_file_sentence_palindrome(path: str, block_size: int = 1 << 16) -> bool:
+    """
+    File-based version of is_sentence_palindrome for UTF-8 text files.
+
+    The file is memory-mapped and read in blocks from both ends at once,
+    comparing normalized characters as they are decoded, so memory use is
+    bounded by block_size whatever the file size.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return True
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            forward = _forward_chars(mm, block_size)
+            backward = _backward_chars(mm, block_size)
+            for left, right in zip(forward, backward):
+                if left != right:
+                    return False
+            return True
+
+
+def _normalize_with_offsets(text: str) -> tuple:
+    """Normalize like is_sentence_palindrome, keeping each character's source index."""
+    if not isinstance(text, str):
+        raise TypeError("Input must be a string")
+    cleaned = []
+    offsets = []
+    for index, char in enumerate(text):
+        if char.isalnum():
+            for lowered in char.lower():
+                cleaned.append(lowered)
+                offsets.append(index)
+    return cleaned, offsets
+
+
+def _manacher(s: list) -> tuple:
+    """Return the odd and even palindrome radii at every center of s in O(n)."""
+    n = len(s)
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and s[i - k] == s[i + k]:
+            k += 1
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and s[i - k - 1] == s[i + k]:
+            k += 1
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+    return odd, even
+
+
+def _center_spans(odd: list, even: list, cleaned: list, offsets: list):
+    """
+    Yield the (start, end) of the maximal palindrome at every center.
+
+    A character whose lowercase form is several code points (such as 'İ')
+    must be kept or dropped whole, so spans ending inside one are trimmed
+    symmetrically, which keeps them palindromic, to the longest span whose
+    ends both fall on source-character boundaries. Spans trimmed to nothing
+    are skipped. Runs in O(n) overall.
+    """
+    n = len(offsets)
+    if len(set(offsets)) == n:
+        # Every character lowered to one code point, so no span needs trimming
+        for i, k in enumerate(odd):
+            yield i - k + 1, i + k
+            if even[i]:
+                yield i - even[i], i + even[i]
+        return
+
+    # Code points that continue a character's lowercase form (the dot of 'İ')
+    inner = {cleaned[q] for q in range(1, n) if offsets[q - 1] == offsets[q]}
+    if any(cleaned[q] in inner for q in range(n) if not q or offsets[q - 1] != offsets[q]):
+        # No code point both starts and continues a character in current
+        # Unicode data; trim one step at a time if that ever changes
+        for i, k in enumerate(odd):
+            for start, end in ((i - k + 1, i + k), (i - even[i], i + even[i])):
+                while start < end and ((start and offsets[start - 1] == offsets[start]) or
+                                       (end < n and offsets[end] == offsets[end - 1])):
+                    start += 1
+                    end -= 1
+                if start < end:
+                    yield start, end
+        return
+
+    # A palindrome's first code point equals its last, so the start is a
+    # boundary exactly when cleaned[end - 1] starts a character. last_end[e]
+    # is then the largest end <= e at which a trimmed span may stop.
+    last_end = [0] * (n + 1)
+    best = 0
+    for end in range(1, n + 1):
+        if cleaned[end - 1] not in inner and (end == n or cleaned[end] not in inner):
+            best = end
+        last_end[end] = best
+    for i, k in enumerate(odd):
+        end = last_end[i + k]
+        if end > i:
+            yield 2 * i + 1 - end, end
+        end = last_end[i + even[i]]
+        if end > i:
+            yield 2 * i - end, end
+
+
+def longest_sentence_palindrome(text: str) -> tuple:
+    """
+    Find the longest sentence-palindromic span of text with Manacher's algorithm.
+
+    Uses the same normalization as is_sentence_palindrome and runs in O(n).
+    Returns (start, end) offsets into the original text, so that
+    text[start:end] is the span; (0, 0) when no span with alphanumerics
+    is a sentence palindrome.
+    """
+    cleaned, offsets = _normalize_with_offsets(text)
+    spans = _center_spans(*_manacher(cleaned), cleaned, offsets)
+    start, end = max(spans, key=lambda span: span[1] - span[0], default=(0, 0))
+    if start == end:
+        return 0, 0
+    return offsets[start], offsets[end - 1] + 1
+
+
+def sentence_palindrome_spans(text: str, min_length: int = 2) -> list:
+    """
+    Find every maximal sentence-palindromic span of text.
+
+    A span is reported for each center whose maximal palindrome has at least
+    min_length normalized characters. Returns sorted, de-duplicated
+    (start, end) offsets into the original text.
+    """
+    cleaned, offsets = _normalize_with_offsets(text)
+    spans = {(offsets[start], offsets[end - 1] + 1)
+             for start, end in _center_spans(*_manacher(cleaned), cleaned, offsets)
+             if end - start >= min_length}
+    return sorted(spans)
+
+
+def run_palindrome_benchmark(length: int = 1_000_000, repeat: int = 5):
+    """Compare both engines on a long palindrome and an early mismatch."""
+    import timeit
+
+    half = "Able was I, ere I saw Elba! " * (length // 56 + 1)
+    palindrome = half[:length // 2] + half[:length // 2][::-1]
+    mismatch = "x" + palindrome + "y"
+    non_ascii = "é" + palindrome + "é"
+
+    print(f"Palindrome Benchmark ({length:,} characters)")
+    print("=" * 70)
+    for name, text in (("long palindrome", palindrome), ("early mismatch", mismatch),
+                       ("non-ASCII", non_ascii)):
+        for engine in (is_sentence_palindrome, is_sentence_palindrome_two_pointer):
+            elapsed = min(timeit.repeat(lambda: engine(text), number=1, repeat=repeat))
+            print(f"{name:16} | {engine.__name__:36} | {elapsed * 1000:9.3f} ms")
+    print("=" * 70)
+
+
+def run_batch_palindrome_benchmark(count: int = 200_000, repeat: int = 5):
+    """Compare a per-call loop with are_sentence_palindromes on short ASCII strings."""
+    import random
+    import timeit
+
+    rng = random.Random(0)
+    words = ["Level", "user_01", "A-b-A", "Rotor 9", "SKU-12-21-UKS", "hello", "Madam!"]
+    sentences = [rng.choice(words) + str(rng.randint(0, 9)) * rng.randint(0, 2)
+                 for _ in range(count)]
+
+    loop = min(timeit.repeat(lambda: [is_sentence_palindrome(s) for s in sentences],
+                             number=1, repeat=repeat))
+    batch = min(timeit.repeat(lambda: are_sentence_palindromes(sentences),
+                              number=1, repeat=repeat))
+
+    print(f"Batch Palindrome Benchmark ({count:,} short ASCII strings)")
+    print("=" * 70)
+    print(f"{'is_sentence_palindrome loop':30} | {loop * 1000:9.1f} ms")
+    print(f"{'are_sentence_palindromes':30} | {batch * 1000:9.1f} ms ({loop / batch:.1f}x)")
+    print("=" * 70)
+
+
 class TestIsSentencePalindrome(unittest.TestCase):
     
     
@@ -233,6 +543,163 @@ class TestIsSentencePalindrome(unittest.TestCase):
             is_sentence_palindrome({"key": "value"})
 
 
+class TestTwoPointerPalindrome(unittest.TestCase):
+    """The two-pointer engine must agree with is_sentence_palindrome"""
+
+    CASES = [
+        "A man a plan a canal Panama", "race a car", "Was it a car or a cat I saw?",
+        "racecar", "hello", "RaCeCaR", "a  man  a", "  racecar  ", "Madam!",
+        "A-man, a plan; a canal: Panama!", "12321", "a1b1a", "12345", "", "a", "Aa",
+        "ab", "   ", "!!!???...", "A1@B@1A", "[a b a]", "a_b_a",
+        "ÉtÉ", "Ésé", "İ", "İi", "iİ", "İİ", "aİa", "ßß", "ǅǆ", "Ⅻ ⅻ", "١٢١", "ΣσΣ",
+    ]
+
+    def test_agrees_on_cases(self):
+        for sentence in self.CASES:
+            with self.subTest(sentence=sentence):
+                self.assertEqual(is_sentence_palindrome_two_pointer(sentence),
+                                 is_sentence_palindrome(sentence))
+
+    def test_agrees_on_random_inputs(self):
+        import random
+        rng = random.Random(0)
+        alphabet = "aAbB1 ,.!_İiéÉß"
+        for _ in range(5000):
+            sentence = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            self.assertEqual(is_sentence_palindrome_two_pointer(sentence),
+                             is_sentence_palindrome(sentence), sentence)
+
+    def test_ascii_blocks_agree_across_block_sizes(self):
+        import random
+        rng = random.Random(1)
+        for _ in range(2000):
+            half = "".join(rng.choice("aAbB1 ,.!_") for _ in range(rng.randint(0, 12)))
+            middle = rng.choice(["", "x", "b,", " "])
+            for sentence in (half + middle + half[::-1], half + middle + half):
+                expected = is_sentence_palindrome(sentence)
+                for block_size in (1, 2, 3, 7, 4096):
+                    self.assertEqual(is_sentence_palindrome_two_pointer(sentence, block_size),
+                                     expected, (sentence, block_size))
+
+    def test_non_string_raises_type_error(self):
+        for value in (None, 12321, 123.21, ["a"], {"key": "value"}):
+            with self.assertRaises(TypeError):
+                is_sentence_palindrome_two_pointer(value)
+
+
+class TestFileSentencePalindrome(unittest.TestCase):
+    """The file-based check must agree with is_sentence_palindrome"""
+
+    def check(self, text, block_size):
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt",
+                                         delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        self.assertEqual(is_file_sentence_palindrome(f.name, block_size),
+                         is_sentence_palindrome(text), text)
+
+    def test_agrees_across_block_sizes(self):
+        for text in TestTwoPointerPalindrome.CASES + ["été\nÉTÉ", "日本日", "日本 語"]:
+            for block_size in (1, 2, 3, 7, 1 << 16):
+                self.check(text, block_size)
+
+    def test_long_multibyte_palindrome(self):
+        half = "Ésope reste ici, 日本 — "
+        self.check(half * 500 + (half * 500)[::-1], 64)
+        self.check(half * 500 + "x" + (half * 500)[::-1] + "y", 64)
+
+
+class TestBatchSentencePalindromes(unittest.TestCase):
+    """The batch API must agree with is_sentence_palindrome"""
+
+    def test_agrees_on_cases(self):
+        cases = TestTwoPointerPalindrome.CASES + ["\tA\x00b\x7fA", "~`a^|a"]
+        self.assertEqual(are_sentence_palindromes(cases),
+                         [is_sentence_palindrome(c) for c in cases])
+
+    def test_agrees_on_all_ascii_characters(self):
+        cases = [chr(b) + "x" + chr(c) for b in range(128) for c in range(0, 128, 7)]
+        self.assertEqual(are_sentence_palindromes(cases),
+                         [is_sentence_palindrome(c) for c in cases])
+
+    def test_accepts_iterables_and_empty_input(self):
+        self.assertEqual(are_sentence_palindromes(iter(["aba", "abc"])), [True, False])
+        self.assertEqual(are_sentence_palindromes([]), [])
+
+    def test_non_string_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            are_sentence_palindromes(["aba", None])
+
+
+class TestPalindromeSearch(unittest.TestCase):
+    """Manacher search over the is_sentence_palindrome normalization"""
+
+    def brute_force_longest(self, text):
+        best = 0
+        for i in range(len(text)):
+            for j in range(i + 1, len(text) + 1):
+                if is_sentence_palindrome(text[i:j]):
+                    best = max(best, self.normalized_length(text[i:j]))
+        return best
+
+    def normalized_length(self, text):
+        return sum(len(ch.lower()) for ch in text if ch.isalnum())
+
+    def test_finds_embedded_sentence(self):
+        text = "Notes: A man, a plan, a canal: Panama! -- end"
+        start, end = longest_sentence_palindrome(text)
+        self.assertEqual(text[start:end], "A man, a plan, a canal: Panama")
+
+    def test_empty_and_no_alphanumerics(self):
+        self.assertEqual(longest_sentence_palindrome(""), (0, 0))
+        self.assertEqual(longest_sentence_palindrome("?! ,"), (0, 0))
+        self.assertEqual(sentence_palindrome_spans(""), [])
+
+    def test_longest_matches_brute_force(self):
+        import random
+        rng = random.Random(0)
+        for alphabet in ("abAB ,1", "iIİ\u0307 ,"):
+            for _ in range(500):
+                text = "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 14)))
+                start, end = longest_sentence_palindrome(text)
+                self.assertTrue(is_sentence_palindrome(text[start:end]), text)
+                self.assertEqual(self.normalized_length(text[start:end]),
+                                 self.brute_force_longest(text), text)
+
+    def test_multi_code_point_runs_stay_linear(self):
+        # Trimming one step at a time was quadratic on runs like these
+        count = 20_000
+        self.assertEqual(longest_sentence_palindrome("İ" * count), (0, 0))
+        self.assertEqual(longest_sentence_palindrome("İi" * count), (0, 2 * count))
+        text = "b" + "İ" * count + "ia"
+        self.assertEqual(longest_sentence_palindrome(text), (1, count + 2))
+        self.assertTrue(is_sentence_palindrome(text[1:count + 2]))
+        self.assertEqual(sentence_palindrome_spans("İ" * count), [])
+
+    def test_multi_code_point_lowercase(self):
+        self.assertEqual(longest_sentence_palindrome("iİ"), (0, 1))
+        self.assertEqual(longest_sentence_palindrome(" İ,"), (0, 0))
+        for text in ("iİ", " İ,", "İİ İ", "ai̇İa"):
+            for start, end in sentence_palindrome_spans(text, min_length=1):
+                self.assertTrue(is_sentence_palindrome(text[start:end]), text)
+
+    def test_spans_above_threshold(self):
+        text = "xx racecar yy, Abba!"
+        spans = sentence_palindrome_spans(text, min_length=4)
+        self.assertIn((3, 10), spans)
+        self.assertIn((15, 19), spans)
+        self.assertIn((0, 2), sentence_palindrome_spans(text, min_length=2))
+        for start, end in spans:
+            self.assertTrue(is_sentence_palindrome(text[start:end]))
+            self.assertGreaterEqual(self.normalized_length(text[start:end]), 4)
+
+    def test_non_string_raises_type_error(self):
+        with self.assertRaises(TypeError):
+            longest_sentence_palindrome(None)
+        with self.assertRaises(TypeError):
+            sentence_palindrome_spans(12321)
+
+
 class TestCaseSummary(unittest.TestCase):
     """Summary and documentation of all test cases"""
     
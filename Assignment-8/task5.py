@@ -1,6 +1,15 @@
+import csv
+import io
+import sys
+import time
 import unittest
+from array import array
+from collections import OrderedDict, deque
 from datetime import datetime
-from typing import List, Tuple
+from decimal import Decimal
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 # --- Implementation under test ---
 
@@ -30,6 +39,270 @@ class ShoppingCart:
         return sum(price for _, price in self._items)
 
 
+class IndexedShoppingCart:
+    """ShoppingCart with O(1) remove_item and total_cost.
+
+    Lines live in an insertion-ordered dict keyed by a running line id, with
+    a per-name deque of line ids so the first occurrence of a name is found
+    without scanning. The total is updated on every add and remove.
+    """
+
+    _price_types: Tuple[type, ...] = (int, float)
+
+    def __init__(self):
+        self._items: Dict[int, Tuple[str, Any]] = {}
+        self._by_name: Dict[str, Deque[int]] = {}
+        self._next_id = 0
+        self._total = self._amount(0)
+
+    def _amount(self, price) -> Any:
+        """Convert a validated price to the cart's stored amount type."""
+        return float(price)
+
+    def add_item(self, name: str, price: float) -> None:
+        if not isinstance(name, str) or not name:
+            raise TypeError("name must be a non-empty string")
+        if not isinstance(price, self._price_types):
+            raise TypeError("price must be a number")
+        amount = self._amount(price)
+        if amount < 0:
+            raise ValueError("price must be non-negative")
+        line_id = self._next_id
+        self._next_id += 1
+        self._items[line_id] = (name, amount)
+        self._by_name.setdefault(name, deque()).append(line_id)
+        self._total += amount
+
+    def remove_item(self, name: str) -> bool:
+        """Remove the first occurrence of an item by name. Return True if removed, False if not found."""
+        ids = self._by_name.get(name)
+        if not ids:
+            return False
+        _, amount = self._items.pop(ids.popleft())
+        if not ids:
+            del self._by_name[name]
+        self._total = _total_after_removal(self._total, amount, self._amount(0),
+                                           not self._items,
+                                           (a for _, a in self._items.values()))
+        return True
+
+    def total_cost(self) -> float:
+        return self._total
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(self._items.values())
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+def _total_after_removal(total, amount, zero, empty: bool, remaining) -> Any:
+    """Return a running cart total after one line's amount is removed.
+
+    remaining is an iterable of the amounts still in the cart; it is only
+    consumed when amount is inf or NaN, since subtracting those leaves NaN
+    and the total must be re-summed like ShoppingCart does.
+    """
+    if amount - amount != 0:
+        return sum(remaining, zero)
+    # Reset on empty so float rounding left by add/subtract cannot linger
+    return zero if empty else total - amount
+
+
+def _to_decimal(price) -> Decimal:
+    """Convert a price to Decimal, using the shortest repr for floats (1.1 -> 1.1)."""
+    value = Decimal(repr(price)) if isinstance(price, float) else Decimal(price)
+    if not value.is_finite():
+        raise ValueError("price must be finite")
+    return value
+
+
+def _to_minor_units(price, minor_units: int) -> int:
+    """Convert a price to an integer count of minor units (cents for minor_units=2)."""
+    minor = _to_decimal(price).scaleb(minor_units)
+    if minor != minor.to_integral_value():
+        raise ValueError(f"price has more than {minor_units} decimal places")
+    return int(minor)
+
+
+class CentsShoppingCart(IndexedShoppingCart):
+    """IndexedShoppingCart that stores prices as integer minor units (cents).
+
+    Totals are exact integer sums. Prices may be int, float or Decimal but
+    must not have more than minor_units decimal places. total_cost() still
+    returns a float for compatibility with ShoppingCart.
+    """
+
+    _price_types = (int, float, Decimal)
+
+    def __init__(self, minor_units: int = 2):
+        self._minor_units = minor_units
+        self._scale = 10 ** minor_units
+        super().__init__()
+
+    def _amount(self, price) -> int:
+        return _to_minor_units(price, self._minor_units)
+
+    def total_cost(self) -> float:
+        return self._total / self._scale
+
+    def total_minor_units(self) -> int:
+        return self._total
+
+    def total_decimal(self) -> Decimal:
+        return Decimal(self._total).scaleb(-self._minor_units)
+
+
+class DecimalShoppingCart(IndexedShoppingCart):
+    """IndexedShoppingCart that stores prices and the total as Decimal.
+
+    total_cost() still returns a float for compatibility with ShoppingCart.
+    """
+
+    _price_types = (int, float, Decimal)
+
+    def _amount(self, price) -> Decimal:
+        return _to_decimal(price)
+
+    def total_cost(self) -> float:
+        return float(self._total)
+
+    def total_decimal(self) -> Decimal:
+        return self._total
+
+
+class ItemNameTable:
+    """Dictionary encoding of item names to small integer ids.
+
+    One table is shared by all CompactShoppingCart instances by default, so
+    each distinct name is stored once no matter how many carts hold it.
+    A table never forgets a name: the shared default grows with every name
+    used in the process, so pass a table per catalog (or per batch of
+    sessions) when names are unbounded, and drop it with its carts.
+    """
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def id_for(self, name: str) -> int:
+        item_id = self._ids.get(name)
+        if item_id is None:
+            item_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return item_id
+
+    def lookup(self, name: str) -> Optional[int]:
+        return self._ids.get(name)
+
+    def name(self, item_id: int) -> str:
+        return self._names[item_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+_SHARED_NAMES = ItemNameTable()
+
+
+class CompactShoppingCart:
+    """Memory-compact ShoppingCart backed by typed arrays.
+
+    Each line is an item id from an ItemNameTable in an array('I') plus a
+    price in an array('d'), or in integer minor units in an array('q') when
+    minor_units is given. The total is kept up to date on add and remove.
+    """
+
+    __slots__ = ("_names", "_name_ids", "_prices", "_scale", "_minor_units", "_total")
+
+    def __init__(self, names: Optional[ItemNameTable] = None,
+                 minor_units: Optional[int] = None):
+        self._names = _SHARED_NAMES if names is None else names
+        self._name_ids = array("I")
+        self._minor_units = minor_units
+        if minor_units is None:
+            self._prices = array("d")
+            self._scale = None
+            self._total = 0.0
+        else:
+            self._prices = array("q")
+            self._scale = 10 ** minor_units
+            self._total = 0
+
+    def add_item(self, name: str, price: float) -> None:
+        if not isinstance(name, str) or not name:
+            raise TypeError("name must be a non-empty string")
+        if self._scale is None:
+            if not isinstance(price, (int, float)):
+                raise TypeError("price must be a number")
+            amount = float(price)
+        else:
+            if not isinstance(price, (int, float, Decimal)):
+                raise TypeError("price must be a number")
+            amount = _to_minor_units(price, self._minor_units)
+            if amount >= 1 << 63:
+                raise ValueError("price is too large")
+        if amount < 0:
+            raise ValueError("price must be non-negative")
+        # Append the price first so a failure cannot leave the arrays out of step
+        self._prices.append(amount)
+        self._name_ids.append(self._names.id_for(name))
+        self._total += amount
+
+    def remove_item(self, name: str) -> bool:
+        """Remove the first occurrence of an item by name. Return True if removed, False if not found."""
+        item_id = self._names.lookup(name)
+        if item_id is None:
+            return False
+        try:
+            index = self._name_ids.index(item_id)
+        except ValueError:
+            return False
+        amount = self._prices[index]
+        del self._name_ids[index]
+        del self._prices[index]
+        zero = 0.0 if self._scale is None else 0
+        self._total = _total_after_removal(self._total, amount, zero,
+                                           not self._prices, self._prices)
+        return True
+
+    def total_cost(self) -> float:
+        if self._scale is None:
+            return self._total
+        return self._total / self._scale
+
+    def items(self) -> List[Tuple[str, Any]]:
+        name = self._names.name
+        return [(name(item_id), price) for item_id, price in zip(self._name_ids, self._prices)]
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+
+def run_cart_memory_benchmark(lines: int = 100_000, distinct_names: int = 1_000):
+    """Compare the memory held by a ShoppingCart and a CompactShoppingCart."""
+    import tracemalloc
+
+    # Each compact cart gets a fresh name table inside the traced region,
+    # so name storage is counted in every run
+    for label, make_cart in (("ShoppingCart", ShoppingCart),
+                             ("CompactShoppingCart",
+                              lambda: CompactShoppingCart(ItemNameTable())),
+                             ("CompactShoppingCart (cents)",
+                              lambda: CompactShoppingCart(ItemNameTable(), minor_units=2))):
+        tracemalloc.start()
+        cart = make_cart()
+        for i in range(lines):
+            cart.add_item(f"sku-{i % distinct_names}", (i % 5000) / 100)
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:28} | {lines:,} lines | {current / 1024:10.1f} KiB "
+              f"| {current / lines:6.1f} bytes/line")
+        del cart
+
+
 def convert_date_format(date_str: str) -> str:
 
     if not isinstance(date_str, str):
@@ -44,23 +317,548 @@ def convert_date_format(date_str: str) -> str:
     return dt.strftime("%d-%m-%Y")
 
 
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def convert_date_format_fast(date_str: str) -> str:
+    """Fast-path convert_date_format for fixed-width YYYY-MM-DD strings.
+
+    Slices the fields, checks month and day against a days-per-month table
+    with the leap-year rule, and rebuilds DD-MM-YYYY without a datetime.
+    Anything else (unpadded fields, years before 1000, ...) goes through
+    convert_date_format, so results and errors are the same.
+    """
+    if not isinstance(date_str, str):
+        raise TypeError("date_str must be a string")
+    date_str = date_str.strip()
+    if (len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-"
+            or not date_str.isascii()):
+        return convert_date_format(date_str)
+
+    year_str = date_str[:4]
+    month_str = date_str[5:7]
+    day_str = date_str[8:]
+    if not (year_str.isdigit() and month_str.isdigit() and day_str.isdigit()):
+        return convert_date_format(date_str)
+
+    year = int(year_str)
+    if year < 1000:
+        return convert_date_format(date_str)
+    month = int(month_str)
+    day = int(day_str)
+    if not 1 <= month <= 12 or day < 1:
+        raise ValueError(f"invalid date format or value: {date_str}")
+    if day > _DAYS_IN_MONTH[month]:
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        if not (month == 2 and day == 29 and leap):
+            raise ValueError(f"invalid date format or value: {date_str}")
+    return f"{day_str}-{month_str}-{year_str}"
+
+
+def _convert_date_or_none(value) -> Optional[str]:
+    """Scalar conversion for one column value; None when it cannot be converted."""
+    try:
+        return convert_date_format_fast(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _convert_date_matrix(np, records):
+    """Validate and reorder an (n, 10) uint8 matrix of YYYY-MM-DD records.
+
+    Returns the DD-MM-YYYY matrix (zeroed where invalid) and a validity mask.
+    """
+    digits = records[:, [0, 1, 2, 3, 5, 6, 8, 9]].astype(np.int16) - 48
+    ok = (records[:, 4] == 45) & (records[:, 7] == 45) & ((digits >= 0) & (digits <= 9)).all(axis=1)
+    digits = digits.astype(np.int32)
+    year = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    month = digits[:, 4] * 10 + digits[:, 5]
+    day = digits[:, 6] * 10 + digits[:, 7]
+    leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    days_in_month = np.array(_DAYS_IN_MONTH)[np.clip(month, 0, 12)] + ((month == 2) & leap)
+    # Years before 1000 are left to the scalar path (platform strftime output)
+    ok &= (year >= 1000) & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+
+    converted = np.ascontiguousarray(records[:, [8, 9, 7, 5, 6, 4, 0, 1, 2, 3]])
+    converted[~ok] = 0
+    return converted, ok
+
+
+def convert_date_column(column) -> Tuple[Any, Any]:
+    """Convert a whole column of YYYY-MM-DD values to DD-MM-YYYY.
+
+    Accepts a list of strings, a NumPy 'U'/'S' string array, or a bytes-like
+    buffer of contiguous 10-byte records. Fixed-width ASCII values are
+    validated with NumPy arithmetic on the digit bytes when NumPy is
+    installed; other values go through convert_date_format_fast. Returns
+    (converted, invalid) where invalid is a row mask instead of an exception.
+    Invalid rows are None in lists, empty in NumPy arrays and zero bytes in
+    buffers.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if isinstance(column, (bytes, bytearray, memoryview)):
+        return _convert_date_buffer(np, bytes(column))
+    if np is not None and isinstance(column, np.ndarray):
+        return _convert_date_array(np, column)
+
+    values = list(column)
+    converted: List[Optional[str]] = [None] * len(values)
+    pending = range(len(values))
+    if np is not None:
+        fixed = [i for i, v in enumerate(values)
+                 if isinstance(v, str) and len(v) == 10 and v.isascii()]
+        if fixed:
+            raw = "".join([values[i] for i in fixed]).encode("ascii")
+            records = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 10).copy()
+            out, ok = _convert_date_matrix(np, records)
+            text = out.tobytes().decode("ascii")
+            for row, i in enumerate(fixed):
+                if ok[row]:
+                    converted[i] = text[row * 10:row * 10 + 10]
+        pending = [i for i in range(len(values)) if converted[i] is None]
+
+    for i in pending:
+        converted[i] = _convert_date_or_none(values[i])
+    return converted, [value is None for value in converted]
+
+
+def _convert_date_buffer(np, data: bytes):
+    if len(data) % 10:
+        raise ValueError("buffer length must be a multiple of 10 bytes")
+    count = len(data) // 10
+    if np is None:
+        out = bytearray(len(data))
+        invalid = []
+        for row in range(count):
+            value = _convert_date_or_none(data[row * 10:row * 10 + 10].decode("latin-1"))
+            bad = value is None or len(value) != 10
+            if not bad:
+                out[row * 10:row * 10 + 10] = value.encode("ascii")
+            invalid.append(bad)
+        return bytes(out), invalid
+
+    records = np.frombuffer(data, dtype=np.uint8).reshape(count, 10).copy()
+    out, ok = _convert_date_matrix(np, records)
+    for row in np.flatnonzero(~ok):
+        value = _convert_date_or_none(data[row * 10:row * 10 + 10].decode("latin-1"))
+        if value is not None and len(value) == 10:
+            out[row] = np.frombuffer(value.encode("ascii"), dtype=np.uint8)
+            ok[row] = True
+    return out.tobytes(), (~ok).tolist()
+
+
+def _convert_date_array(np, column):
+    values = column.ravel()
+    kind = values.dtype.kind
+    if kind == "U" and values.dtype.itemsize == 40:
+        codes = values.view(np.uint32).reshape(-1, 10)
+        ascii_rows = (codes < 128).all(axis=1)
+        records = np.where(ascii_rows[:, None], codes, 0).astype(np.uint8)
+    elif kind == "S" and values.dtype.itemsize == 10:
+        records = values.view(np.uint8).reshape(-1, 10).copy()
+    else:
+        converted, invalid = convert_date_column(values.tolist())
+        out = np.array([value or "" for value in converted], dtype="U10")
+        return out.reshape(column.shape), np.array(invalid, dtype=bool).reshape(column.shape)
+
+    out, ok = _convert_date_matrix(np, records)
+    if kind == "U":
+        result = out.astype(np.uint32).view("U10").ravel()
+    else:
+        result = out.view("S10").ravel()
+    for row in np.flatnonzero(~ok):
+        value = values[row]
+        value = _convert_date_or_none(value if kind == "U" else value.decode("latin-1"))
+        if value is not None and (kind == "U" or len(value) == 10):
+            result[row] = value
+            ok[row] = True
+    return result.reshape(column.shape), (~ok).reshape(column.shape)
+
+
+# Fixed-width directives supported by date conversion plans:
+# directive -> (width, smallest value, largest value)
+_PLAN_FIELDS = {
+    "Y": (4, 1, 9999),
+    "m": (2, 1, 12),
+    "d": (2, 1, 31),
+    "H": (2, 0, 23),
+    "M": (2, 0, 59),
+    "S": (2, 0, 59),
+}
+
+
+def _parse_plan_format(fmt: str) -> List[Tuple[str, str]]:
+    """Split a format into ("field", directive) and ("literal", text) tokens."""
+    tokens = []
+    i = 0
+    while i < len(fmt):
+        if fmt[i] == "%":
+            directive = fmt[i + 1:i + 2]
+            if directive == "%":
+                tokens.append(("literal", "%"))
+            elif directive in _PLAN_FIELDS:
+                tokens.append(("field", directive))
+            else:
+                raise ValueError(f"unsupported directive in format: %{directive}")
+            i += 2
+        else:
+            tokens.append(("literal", fmt[i]))
+            i += 1
+    return tokens
+
+
+class DateConversionPlan:
+    """A source/target date format pair compiled once into slice offsets.
+
+    Calling the plan validates and converts one value: fixed-width ASCII
+    input is checked for its literal separators and digit fields, month,
+    day (with the leap-year rule) and time ranges, and the output is
+    assembled from source slices with a precomputed template. Raises
+    TypeError for non-strings and ValueError for bad input, like
+    convert_date_format.
+    """
+
+    def __init__(self, source_fmt: str, target_fmt: str):
+        self.source_fmt = source_fmt
+        self.target_fmt = target_fmt
+
+        offsets = {}
+        literals = []
+        position = 0
+        for kind, value in _parse_plan_format(source_fmt):
+            if kind == "literal":
+                literals.append((position, value))
+                position += 1
+            else:
+                if value in offsets:
+                    raise ValueError(f"repeated directive in source format: %{value}")
+                width = _PLAN_FIELDS[value][0]
+                offsets[value] = (position, position + width)
+                position += width
+        self.width = position
+
+        template = []
+        slices = []
+        for kind, value in _parse_plan_format(target_fmt):
+            if kind == "literal":
+                template.append(value.replace("{", "{{").replace("}", "}}"))
+            else:
+                if value not in offsets:
+                    raise ValueError(f"target directive %{value} is missing from the source format")
+                template.append("{%d}" % len(slices))
+                slices.append(slice(*offsets[value]))
+
+        # The trailing empty slice makes itemgetter always return a tuple
+        fields = sorted(offsets)
+        self._field_getter = itemgetter(*[slice(*offsets[f]) for f in fields], slice(0, 0))
+        self._bounds = tuple(_PLAN_FIELDS[f][1:] for f in fields)
+        self._day = fields.index("d") if "d" in offsets else None
+        self._month = fields.index("m") if "m" in offsets else None
+        self._year = fields.index("Y") if "Y" in offsets else None
+        self._literals = tuple(literals)
+        self._template = "".join(template)
+        self._output_getter = itemgetter(*slices, slice(0, 0))
+
+    def __repr__(self):
+        return f"DateConversionPlan({self.source_fmt!r}, {self.target_fmt!r})"
+
+    def __call__(self, date_str: str) -> str:
+        if not isinstance(date_str, str):
+            raise TypeError("date_str must be a string")
+        date_str = date_str.strip()
+        if not date_str:
+            raise ValueError("empty date string")
+        if len(date_str) != self.width or not date_str.isascii():
+            raise ValueError(f"invalid date format or value: {date_str}")
+        for position, char in self._literals:
+            if date_str[position] != char:
+                raise ValueError(f"invalid date format or value: {date_str}")
+
+        parts = self._field_getter(date_str)
+        if self._bounds and not "".join(parts).isdigit():
+            raise ValueError(f"invalid date format or value: {date_str}")
+        values = [int(text) for text in parts[:-1]]
+        for value, (low, high) in zip(values, self._bounds):
+            if not low <= value <= high:
+                raise ValueError(f"invalid date format or value: {date_str}")
+
+        if self._day is not None and values[self._day] > 28:
+            day = values[self._day]
+            month = 1 if self._month is None else values[self._month]
+            if day > _DAYS_IN_MONTH[month]:
+                year = 2000 if self._year is None else values[self._year]
+                leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+                if not (month == 2 and day == 29 and leap):
+                    raise ValueError(f"invalid date format or value: {date_str}")
+
+        return self._template.format(*self._output_getter(date_str))
+
+
+_PLAN_CACHE: Dict[Tuple[str, str], DateConversionPlan] = {}
+
+
+def date_converter(source_fmt: str = "%Y-%m-%d", target_fmt: str = "%d-%m-%Y") -> DateConversionPlan:
+    """Return the cached DateConversionPlan for a source/target format pair.
+
+    Supported directives are %Y, %m, %d, %H, %M, %S and %% (all fixed width);
+    other characters are literal.
+    """
+    key = (source_fmt, target_fmt)
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        plan = _PLAN_CACHE[key] = DateConversionPlan(source_fmt, target_fmt)
+    return plan
+
+
+class CachedDateConverter:
+    """Bounded LRU cache in front of a date converter.
+
+    Both results and ValueError rejections are cached, so a repeated value
+    costs one dict lookup; cached rejections raise the same ValueError
+    message every time. Non-string input raises TypeError and is not cached.
+    """
+
+    def __init__(self, maxsize: int = 4096, convert=convert_date_format_fast):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._convert = convert
+        self._cache: "OrderedDict[str, Tuple[bool, str]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, date_str: str) -> str:
+        if not isinstance(date_str, str):
+            raise TypeError("date_str must be a string")
+        cache = self._cache
+        entry = cache.get(date_str)
+        if entry is None:
+            self.misses += 1
+            try:
+                entry = (True, self._convert(date_str))
+            except ValueError as e:
+                entry = (False, str(e))
+            cache[date_str] = entry
+            if len(cache) > self.maxsize:
+                cache.popitem(last=False)
+        else:
+            self.hits += 1
+            cache.move_to_end(date_str)
+
+        ok, value = entry
+        if not ok:
+            raise ValueError(value)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+convert_date_format_cached = CachedDateConverter()
+
+
+def _date_error_category(value: str) -> str:
+    """Classify why a date field was rejected."""
+    value = value.strip()
+    if not value:
+        return "empty"
+    if len(value) == 10 and value[4] == "-" and value[7] == "-" and \
+            (value[:4] + value[5:7] + value[8:]).isdigit():
+        return "value"
+    return "format"
+
+
+class DateRewriteReport:
+    """Counts and timing for one rewrite_date_columns run."""
+
+    def __init__(self):
+        self.rows = 0
+        self.bad_rows = 0
+        self.errors: Dict[str, int] = {}
+        self.elapsed = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> str:
+        errors = ", ".join(f"{k}: {v}" for k, v in sorted(self.errors.items())) or "none"
+        return (f"{self.rows:,} rows in {self.elapsed:.2f}s ({self.rows_per_second:,.0f} rows/s), "
+                f"{self.bad_rows:,} bad rows ({errors})")
+
+
+def rewrite_date_columns(infile, outfile, columns: List[str], bad_rows=None,
+                         convert=convert_date_format_cached, delimiter: str = ",",
+                         chunk_rows: int = 10_000) -> DateRewriteReport:
+    """Stream a CSV file, converting the named date columns to DD-MM-YYYY.
+
+    Rows are read and written in chunks of chunk_rows, so memory stays flat
+    for any file size. convert defaults to the cached fast path, which gives
+    the same results and errors as convert_date_format. Rows with a bad date
+    (or too few fields) go to bad_rows with the error in the column after the
+    header's columns; short rows are padded to reach it and extra fields
+    follow it, so no data is lost. Bad rows are counted by category (empty,
+    format, value, short_row) in the returned report. Blank lines are
+    skipped, as csv.DictReader does.
+    """
+    started = time.perf_counter()
+    report = DateRewriteReport()
+    reader = csv.reader(infile, delimiter=delimiter)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("missing header row")
+    missing = [c for c in columns if c not in header]
+    if missing:
+        raise ValueError(f"missing date columns: {', '.join(missing)}")
+    indexes = [header.index(c) for c in columns]
+    width = max(indexes) + 1
+    header_width = len(header)
+
+    writer = csv.writer(outfile, delimiter=delimiter, lineterminator="\n")
+    writer.writerow(header)
+    bad_writer = None
+    if bad_rows is not None:
+        bad_writer = csv.writer(bad_rows, delimiter=delimiter, lineterminator="\n")
+        bad_writer.writerow(header + ["error"])
+
+    errors = report.errors
+    while True:
+        chunk = list(islice(reader, chunk_rows))
+        if not chunk:
+            break
+        good = []
+        bad = []
+        blank = 0
+        for row in chunk:
+            if not row:
+                blank += 1
+                continue
+            if len(row) < width:
+                category = "short_row"
+            else:
+                try:
+                    # Convert every column before touching the row, so bad
+                    # rows are written out with their original values
+                    values = [convert(row[i]) for i in indexes]
+                except ValueError:
+                    # Find the failing column; this only runs for bad rows
+                    for i in indexes:
+                        try:
+                            convert(row[i])
+                        except ValueError:
+                            break
+                    category = _date_error_category(row[i])
+                else:
+                    for i, value in zip(indexes, values):
+                        row[i] = value
+                    good.append(row)
+                    continue
+            errors[category] = errors.get(category, 0) + 1
+            # Keep the error in the header's error column; extra fields follow it
+            padding = [""] * (header_width - len(row))
+            bad.append(row[:header_width] + padding + [category] + row[header_width:])
+        writer.writerows(good)
+        if bad_writer is not None:
+            bad_writer.writerows(bad)
+        report.rows += len(chunk) - blank
+        report.bad_rows += len(bad)
+
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+def rewrite_date_csv(in_path: str, out_path: str, columns: List[str],
+                     bad_path: Optional[str] = None, buffer_size: int = 1 << 20,
+                     **kwargs) -> DateRewriteReport:
+    """File-path wrapper around rewrite_date_columns with buffered I/O.
+
+    Prints the report summary to stderr when done.
+    """
+    with open(in_path, newline="", encoding="utf-8", buffering=buffer_size) as infile, \
+            open(out_path, "w", newline="", encoding="utf-8", buffering=buffer_size) as outfile:
+        if bad_path is None:
+            report = rewrite_date_columns(infile, outfile, columns, **kwargs)
+        else:
+            with open(bad_path, "w", newline="", encoding="utf-8") as bad_rows:
+                report = rewrite_date_columns(infile, outfile, columns, bad_rows, **kwargs)
+    print(report.summary(), file=sys.stderr)
+    return report
+
+
+def run_date_benchmark(count: int = 200_000, repeat: int = 3):
+    """Compare convert_date_format with convert_date_format_fast."""
+    import random
+    import timeit
+
+    rng = random.Random(0)
+    # One year of dates: the low-cardinality shape of real date columns
+    dates = [f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}" for _ in range(count)]
+
+    for func in (convert_date_format, convert_date_format_fast, CachedDateConverter()):
+        elapsed = min(timeit.repeat(lambda: [func(d) for d in dates], number=1, repeat=repeat))
+        name = getattr(func, "__name__", type(func).__name__)
+        print(f"{name:28} | {count / elapsed:12,.0f} dates/s")
+
+    elapsed = min(timeit.repeat(lambda: convert_date_column(dates), number=1, repeat=repeat))
+    print(f"{'convert_date_column':28} | {count / elapsed:12,.0f} dates/s")
+
+
+def run_format_benchmark(count: int = 100_000, repeat: int = 3):
+    """Compare compiled conversion plans with strptime/strftime per format pair."""
+    import random
+    import timeit
+
+    rng = random.Random(0)
+    moments = [datetime(2024, rng.randint(1, 12), rng.randint(1, 28),
+                        rng.randint(0, 23), rng.randint(0, 59), rng.randint(0, 59))
+               for _ in range(count)]
+    pairs = [("%Y-%m-%d", "%d-%m-%Y"), ("%Y%m%d", "%Y-%m-%d"),
+             ("%d/%m/%Y", "%Y-%m-%d"), ("%Y-%m-%dT%H:%M:%S", "%d-%m-%Y %H:%M:%S")]
+
+    for source_fmt, target_fmt in pairs:
+        values = [m.strftime(source_fmt) for m in moments]
+        plan = date_converter(source_fmt, target_fmt)
+        baseline = min(timeit.repeat(
+            lambda: [datetime.strptime(v, source_fmt).strftime(target_fmt) for v in values],
+            number=1, repeat=repeat))
+        compiled = min(timeit.repeat(lambda: [plan(v) for v in values], number=1, repeat=repeat))
+        print(f"{source_fmt:18} -> {target_fmt:18} | strptime {count / baseline:10,.0f}/s "
+              f"| plan {count / compiled:10,.0f}/s ({baseline / compiled:.1f}x)")
+
+
 # --- Tests ---
 
 class TestShoppingCart(unittest.TestCase):
+    cart_class = ShoppingCart
+
     def test_add_single_item_and_total(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         cart.add_item("apple", 1.50)
         self.assertAlmostEqual(cart.total_cost(), 1.50)
 
     def test_add_multiple_items_and_total(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         cart.add_item("apple", 1.50)
         cart.add_item("banana", 0.75)
         cart.add_item("milk", 2.00)
         self.assertAlmostEqual(cart.total_cost(), 4.25)
 
     def test_remove_item_reduces_total(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         cart.add_item("apple", 1.50)
         cart.add_item("banana", 0.75)
         removed = cart.remove_item("banana")
@@ -68,26 +866,26 @@ class TestShoppingCart(unittest.TestCase):
         self.assertAlmostEqual(cart.total_cost(), 1.50)
 
     def test_remove_nonexistent_item_returns_false(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         cart.add_item("apple", 1.50)
         removed = cart.remove_item("orange")
         self.assertFalse(removed)
         self.assertAlmostEqual(cart.total_cost(), 1.50)
 
     def test_add_negative_price_raises(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         with self.assertRaises(ValueError):
             cart.add_item("apple", -0.99)
 
     def test_add_invalid_name_or_price_type_raises(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         with self.assertRaises(TypeError):
             cart.add_item("", 1.0)
         with self.assertRaises(TypeError):
             cart.add_item("apple", "one dollar")
 
     def test_duplicate_items_are_allowed_and_removed_one_by_one(self):
-        cart = ShoppingCart()
+        cart = self.cart_class()
         cart.add_item("cookie", 1.00)
         cart.add_item("cookie", 1.00)
         self.assertAlmostEqual(cart.total_cost(), 2.00)
@@ -101,39 +899,341 @@ class TestShoppingCart(unittest.TestCase):
         self.assertFalse(cart.remove_item("cookie"))
 
 
+class TestIndexedShoppingCart(TestShoppingCart):
+    cart_class = IndexedShoppingCart
+
+    def test_removes_first_occurrence_among_interleaved_names(self):
+        cart = self.cart_class()
+        cart.add_item("cookie", 1.00)
+        cart.add_item("milk", 2.00)
+        cart.add_item("cookie", 3.00)
+        self.assertTrue(cart.remove_item("cookie"))
+        self.assertEqual(cart.items(), [("milk", 2.00), ("cookie", 3.00)])
+        self.assertAlmostEqual(cart.total_cost(), 5.00)
+        self.assertEqual(len(cart), 2)
+
+    def test_total_resets_exactly_when_emptied(self):
+        cart = self.cart_class()
+        for price in (0.1, 0.2, 0.3):
+            cart.add_item("item", price)
+        for _ in range(3):
+            cart.remove_item("item")
+        self.assertEqual(cart.total_cost(), 0.0)
+
+    def test_total_recovers_after_removing_non_finite_price(self):
+        for bad in (float("inf"), float("nan")):
+            cart = self.cart_class()
+            reference = ShoppingCart()
+            for c in (cart, reference):
+                c.add_item("bad", bad)
+                c.add_item("ok", 1.0)
+                c.remove_item("bad")
+            self.assertEqual(cart.total_cost(), reference.total_cost())
+            self.assertEqual(cart.total_cost(), 1.0)
+
+
+class TestCentsShoppingCart(TestShoppingCart):
+    cart_class = CentsShoppingCart
+
+    def test_total_is_exact(self):
+        cart = self.cart_class()
+        for _ in range(10):
+            cart.add_item("candy", 0.10)
+        cart.add_item("gum", Decimal("0.25"))
+        self.assertEqual(cart.total_minor_units(), 125)
+        self.assertEqual(cart.total_decimal(), Decimal("1.25"))
+        self.assertEqual(cart.total_cost(), 1.25)
+        cart.remove_item("candy")
+        self.assertEqual(cart.total_decimal(), Decimal("1.15"))
+
+    def test_other_minor_units(self):
+        cart = CentsShoppingCart(minor_units=0)
+        cart.add_item("yen", 150)
+        self.assertEqual(cart.total_minor_units(), 150)
+        with self.assertRaises(ValueError):
+            cart.add_item("yen", 1.5)
+
+    def test_too_many_decimal_places_raises(self):
+        cart = self.cart_class()
+        with self.assertRaises(ValueError):
+            cart.add_item("apple", Decimal("1.005"))
+        with self.assertRaises(ValueError):
+            cart.add_item("apple", float("nan"))
+        self.assertEqual(len(cart), 0)
+
+
+class TestDecimalShoppingCart(TestShoppingCart):
+    cart_class = DecimalShoppingCart
+
+    def test_total_is_exact(self):
+        cart = self.cart_class()
+        cart.add_item("a", 0.1)
+        cart.add_item("b", 0.2)
+        cart.add_item("c", Decimal("0.005"))
+        self.assertEqual(cart.total_decimal(), Decimal("0.305"))
+        cart.remove_item("b")
+        self.assertEqual(cart.total_decimal(), Decimal("0.105"))
+        with self.assertRaises(ValueError):
+            cart.add_item("d", Decimal("-1"))
+
+
+class TestCompactShoppingCart(TestShoppingCart):
+    cart_class = CompactShoppingCart
+
+    def test_items_keep_order_and_first_occurrence_removal(self):
+        cart = self.cart_class()
+        cart.add_item("cookie", 1.00)
+        cart.add_item("milk", 2.00)
+        cart.add_item("cookie", 3.00)
+        self.assertTrue(cart.remove_item("cookie"))
+        self.assertEqual(cart.items(), [("milk", 2.00), ("cookie", 3.00)])
+        self.assertEqual(len(cart), 2)
+
+    def test_names_are_shared_between_carts(self):
+        names = ItemNameTable()
+        first = CompactShoppingCart(names)
+        second = CompactShoppingCart(names)
+        first.add_item("apple", 1.0)
+        second.add_item("apple", 2.0)
+        second.add_item("pear", 2.0)
+        self.assertEqual(len(names), 2)
+        self.assertFalse(first.remove_item("pear"))
+
+    def test_no_instance_dict(self):
+        with self.assertRaises(AttributeError):
+            self.cart_class().extra = 1
+
+    def test_cents_mode_is_exact(self):
+        cart = CompactShoppingCart(minor_units=2)
+        for _ in range(10):
+            cart.add_item("candy", 0.10)
+        self.assertEqual(cart.total_cost(), 1.00)
+        cart.remove_item("candy")
+        self.assertEqual(cart.items()[0], ("candy", 10))
+        with self.assertRaises(ValueError):
+            cart.add_item("candy", 0.105)
+
+    def test_rejected_price_keeps_arrays_in_step(self):
+        cart = CompactShoppingCart(ItemNameTable(), minor_units=2)
+        with self.assertRaises(ValueError):
+            cart.add_item("x", 10 ** 18)
+        cart.add_item("y", 1)
+        self.assertEqual(cart.items(), [("y", 100)])
+        self.assertEqual(cart.total_cost(), 1.0)
+
+    def test_total_recovers_after_removing_non_finite_price(self):
+        cart = self.cart_class(ItemNameTable())
+        cart.add_item("bad", float("inf"))
+        cart.add_item("ok", 1.0)
+        cart.remove_item("bad")
+        self.assertEqual(cart.total_cost(), 1.0)
+
+
 class TestConvertDateFormat(unittest.TestCase):
+    convert = staticmethod(convert_date_format)
+
     def test_standard_conversion(self):
-        self.assertEqual(convert_date_format("2025-12-31"), "31-12-2025")
+        self.assertEqual(self.convert("2025-12-31"), "31-12-2025")
 
     def test_leap_day_conversion(self):
-        self.assertEqual(convert_date_format("2020-02-29"), "29-02-2020")
+        self.assertEqual(self.convert("2020-02-29"), "29-02-2020")
 
     def test_invalid_format_raises(self):
         with self.assertRaises(ValueError):
-            convert_date_format("31-12-2025")  # wrong input format
+            self.convert("31-12-2025")  # wrong input format
 
     def test_invalid_date_raises(self):
         with self.assertRaises(ValueError):
-            convert_date_format("2021-02-29")  # 2021 not a leap year
+            self.convert("2021-02-29")  # 2021 not a leap year
 
     def test_empty_string_raises(self):
         with self.assertRaises(ValueError):
-            convert_date_format("")
+            self.convert("")
 
     def test_non_string_raises_type_error(self):
         with self.assertRaises(TypeError):
-            convert_date_format(20251231)
+            self.convert(20251231)
 
     def test_whitespace_around_input(self):
-        self.assertEqual(convert_date_format(" 2023-01-05 "), "05-01-2023")
+        self.assertEqual(self.convert(" 2023-01-05 "), "05-01-2023")
 
     def test_month_out_of_range_raises(self):
         with self.assertRaises(ValueError):
-            convert_date_format("2023-13-01")
+            self.convert("2023-13-01")
 
     def test_day_out_of_range_raises(self):
         with self.assertRaises(ValueError):
-            convert_date_format("2023-04-31")  # April has 30 days
+            self.convert("2023-04-31")  # April has 30 days
+
+
+class TestConvertDateFormatFast(TestConvertDateFormat):
+    convert = staticmethod(convert_date_format_fast)
+
+    def test_matches_strptime_path(self):
+        cases = ["2000-02-29", "1900-02-29", "2024-02-29", "2023-02-28", "2023-00-10",
+                 "2023-06-00", "2023-06-31", "2023-12-31", "0999-01-01", "2023-1-5",
+                 "2023/01/05", "20230105", "abcd-ef-gh", "2023-01-0\u0665",
+                 "\uff12\uff10\uff12\uff13-01-05", "+023-01-05", "2023-01-05x"]
+        for year in (1999, 2000, 2023, 2024):
+            for month in range(1, 13):
+                for day in (1, 28, 29, 30, 31, 32):
+                    cases.append(f"{year}-{month:02d}-{day:02d}")
+        for case in cases:
+            try:
+                expected = convert_date_format(case)
+            except ValueError:
+                with self.assertRaises(ValueError, msg=case):
+                    convert_date_format_fast(case)
+            else:
+                self.assertEqual(convert_date_format_fast(case), expected, case)
+
+
+class TestCachedDateConverter(TestConvertDateFormat):
+    convert = staticmethod(CachedDateConverter(maxsize=4))
+
+    def test_repeated_values_hit_the_cache(self):
+        convert = CachedDateConverter(maxsize=2)
+        for _ in range(3):
+            self.assertEqual(convert("2025-12-31"), "31-12-2025")
+        self.assertEqual((convert.hits, convert.misses), (2, 1))
+        self.assertAlmostEqual(convert.hit_rate, 2 / 3)
+
+    def test_cached_rejection_raises_same_error(self):
+        convert = CachedDateConverter()
+        messages = []
+        for _ in range(2):
+            with self.assertRaises(ValueError) as ctx:
+                convert("2021-02-29")
+            messages.append(str(ctx.exception))
+        self.assertEqual(messages[0], messages[1])
+        self.assertEqual(convert.hits, 1)
+
+    def test_size_is_bounded_lru(self):
+        convert = CachedDateConverter(maxsize=2)
+        convert("2025-01-01")
+        convert("2025-01-02")
+        convert("2025-01-01")
+        convert("2025-01-03")
+        self.assertEqual(len(convert), 2)
+        convert("2025-01-01")
+        self.assertEqual(convert.hits, 2)
+        convert.clear()
+        self.assertEqual((len(convert), convert.hits, convert.misses), (0, 0, 0))
+
+
+class TestDateConversionPlan(TestConvertDateFormat):
+    convert = staticmethod(date_converter("%Y-%m-%d", "%d-%m-%Y"))
+
+    def test_plans_match_strptime(self):
+        pairs = [("%Y%m%d", "%Y-%m-%d"), ("%d/%m/%Y", "%Y-%m-%d"),
+                 ("%Y-%m-%dT%H:%M:%S", "%d-%m-%Y %H:%M:%S"), ("%Y-%m-%d", "%d.%m.%Y {%%}")]
+        samples = [datetime(2024, 2, 29, 23, 59, 59), datetime(1999, 12, 31, 0, 0, 0),
+                   datetime(2023, 4, 30, 12, 5, 9)]
+        for source_fmt, target_fmt in pairs:
+            plan = date_converter(source_fmt, target_fmt)
+            for moment in samples:
+                self.assertEqual(plan(moment.strftime(source_fmt)), moment.strftime(target_fmt))
+
+    def test_invalid_values_raise(self):
+        plan = date_converter("%Y-%m-%dT%H:%M:%S", "%H:%M")
+        for value in ("2023-02-29T10:00:00", "2023-01-01T24:00:00", "2023-01-01T10:60:00",
+                      "2023-01-01 10:00:00", "2023-01-01T10:00", "0000-01-01T10:00:00"):
+            with self.assertRaises(ValueError, msg=value):
+                plan(value)
+        self.assertEqual(date_converter("%d/%m/%Y", "%Y%m%d")("29/02/2000"), "20000229")
+        with self.assertRaises(ValueError):
+            date_converter("%d/%m/%Y", "%Y%m%d")("29/02/1900")
+
+    def test_plans_are_cached(self):
+        self.assertIs(date_converter("%Y%m%d", "%d-%m-%Y"), date_converter("%Y%m%d", "%d-%m-%Y"))
+
+    def test_bad_formats_raise(self):
+        with self.assertRaises(ValueError):
+            DateConversionPlan("%Y-%b-%d", "%d-%m-%Y")
+        with self.assertRaises(ValueError):
+            DateConversionPlan("%Y-%m", "%d-%m-%Y")
+        with self.assertRaises(ValueError):
+            DateConversionPlan("%Y-%Y", "%Y")
+
+
+class TestConvertDateColumn(unittest.TestCase):
+    VALUES = ["2025-12-31", "2020-02-29", "31-12-2025", "2021-02-29", "",
+              " 2023-01-05 ", "2023-13-01", "2023-04-31", "1900-02-29", "2000-02-29"]
+
+    def expected(self):
+        converted = []
+        for value in self.VALUES:
+            try:
+                converted.append(convert_date_format(value))
+            except ValueError:
+                converted.append(None)
+        return converted
+
+    def test_list_column(self):
+        converted, invalid = convert_date_column(self.VALUES + [None])
+        self.assertEqual(converted, self.expected() + [None])
+        self.assertEqual(invalid, [v is None for v in self.expected()] + [True])
+
+    def test_bytes_buffer(self):
+        data = b"2025-12-312021-02-292000-02-29x023-01-05"
+        converted, invalid = convert_date_column(data)
+        self.assertEqual(converted, b"31-12-2025" + b"\0" * 10 + b"29-02-2000" + b"\0" * 10)
+        self.assertEqual(invalid, [False, True, False, True])
+        with self.assertRaises(ValueError):
+            convert_date_column(b"2025-12-3")
+
+    def test_numpy_arrays(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        expected = [v or "" for v in self.expected()]
+        converted, invalid = convert_date_column(np.array(self.VALUES))
+        self.assertEqual(converted.tolist(), expected)
+        self.assertEqual(invalid.tolist(), [v == "" for v in expected])
+
+        fixed = [v for v in self.VALUES if len(v) == 10]
+        converted, invalid = convert_date_column(np.array(fixed, dtype="S10"))
+        self.assertEqual([v.decode() for v in converted.tolist()],
+                         [_convert_date_or_none(v) or "" for v in fixed])
+        self.assertEqual(convert_date_column(np.array(["2024-02-29"], dtype="U10"))[0].tolist(),
+                         ["29-02-2024"])
+
+
+class TestRewriteDateColumns(unittest.TestCase):
+    def test_converts_columns_and_reports_errors(self):
+        infile = io.StringIO(
+            "id,start,end\n"
+            "1,2025-12-31,2020-02-29\n"
+            "2,2021-02-29,2020-01-01\n"
+            "3,2024-01-01,31-12-2025\n"
+            "4,,2024-01-01\n"
+            "5,2024-01-01\n"
+            "\n"
+            "6, 2023-01-05 ,2023-04-30\n"
+            "7,2024-01-01,bad,extra\n"
+        )
+        outfile = io.StringIO()
+        bad_rows = io.StringIO()
+        report = rewrite_date_columns(infile, outfile, ["start", "end"], bad_rows, chunk_rows=2)
+        self.assertEqual(outfile.getvalue(),
+                         "id,start,end\n1,31-12-2025,29-02-2020\n6,05-01-2023,30-04-2023\n")
+        self.assertEqual(bad_rows.getvalue().splitlines(), [
+            "id,start,end,error",
+            "2,2021-02-29,2020-01-01,value",
+            "3,2024-01-01,31-12-2025,format",
+            "4,,2024-01-01,empty",
+            "5,2024-01-01,,short_row",
+            "7,2024-01-01,bad,format,extra",
+        ])
+        self.assertEqual(report.rows, 7)
+        self.assertEqual(report.bad_rows, 5)
+        self.assertEqual(report.errors, {"value": 1, "format": 2, "empty": 1, "short_row": 1})
+        self.assertIn("7 rows", report.summary())
+
+    def test_missing_column_raises(self):
+        with self.assertRaises(ValueError):
+            rewrite_date_columns(io.StringIO("id,day\n1,2024-01-01\n"), io.StringIO(), ["date"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,78 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from task1 import (
+    BACKENDS,
+    TEST_CASES,
+    classify_emails,
+    is_valid_email,
+    parallel_validate,
+    stream_validate,
+    validate_emails,
+)
+
+
+def fuzz_inputs(count: int = 20_000, seed: int = 0) -> list:
+    """TEST_CASES addresses, a few non-strings and random short strings."""
+    rng = random.Random(seed)
+    alphabet = 'ab1.@-_ #\t\xa0\u00e9'
+    inputs = [email for email, _, _ in TEST_CASES] + [None, 42, ' a@b.co ']
+    inputs += [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+               for _ in range(count)]
+    return inputs
+
+
+class TestValidatorsAgree(unittest.TestCase):
+    """Every fast path must give exactly the verdicts of is_valid_email."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.inputs = fuzz_inputs()
+        cls.expected = [is_valid_email(email) for email in cls.inputs]
+
+    def test_validate_emails(self):
+        self.assertEqual(validate_emails(self.inputs), self.expected)
+
+    def test_backends(self):
+        for name, backend in BACKENDS.items():
+            with self.subTest(backend=name):
+                self.assertEqual([backend(email) for email in self.inputs], self.expected)
+
+    def test_classify_emails(self):
+        self.assertEqual(classify_emails(self.inputs)[0], self.expected)
+
+
+class TestStreamValidate(unittest.TestCase):
+    def setUp(self):
+        # Line-based paths only see strings without embedded newlines
+        self.emails = [e for e in fuzz_inputs(5_000, seed=1)
+                       if isinstance(e, str) and '\n' not in e]
+        self.text = ''.join(email + '\n' for email in self.emails)
+        self.expected = [is_valid_email(email) for email in self.emails]
+
+    def check_output(self, out: str, counts: tuple):
+        verdicts = [line.rsplit('\t', 1)[1] == 'valid' for line in out.splitlines()]
+        self.assertEqual(verdicts, self.expected)
+        self.assertEqual(counts, (sum(self.expected), len(self.expected) - sum(self.expected)))
+
+    def test_stream_matches_is_valid_email(self):
+        out = io.StringIO()
+        counts = stream_validate(io.StringIO(self.text), out, chunk_size=256)
+        self.check_output(out.getvalue(), counts)
+
+    def test_parallel_matches_is_valid_email(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'emails.txt')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(self.text)
+            results = list(parallel_validate(path, workers=2, chunk_bytes=4096))
+        self.assertGreater(len(results), 1)
+        counts = (sum(r[0] for r in results), sum(r[1] for r in results))
+        self.check_output(''.join(r[2] for r in results), counts)
+
+
+if __name__ == '__main__':
+    unittest.main()
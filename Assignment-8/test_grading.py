@@ -0,0 +1,295 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from array import array
+
+from grading import (
+    DEFAULT_SCALE,
+    PASS_FAIL_SCALE,
+    PLUS_MINUS_SCALE,
+    GradeStats,
+    GradingScale,
+    assign_grade,
+    assign_grades,
+    grade_csv,
+    grade_gradebooks,
+    grading_scale,
+)
+
+
+class TestGradingScale(unittest.TestCase):
+    def test_default_scale_matches_if_chain(self):
+        def if_chain(score):
+            if score >= 90:
+                return "A"
+            if score >= 80:
+                return "B"
+            if score >= 70:
+                return "C"
+            if score >= 60:
+                return "D"
+            return "F"
+
+        for score in list(range(101)) + [i / 8 for i in range(801)]:
+            self.assertEqual(DEFAULT_SCALE.grade(score), if_chain(score))
+        self.assertEqual(DEFAULT_SCALE.grade(float("nan")), "F")
+
+    def test_plus_minus_scale(self):
+        self.assertEqual(PLUS_MINUS_SCALE.grade(100), "A+")
+        self.assertEqual(PLUS_MINUS_SCALE.grade(92.9), "A-")
+        self.assertEqual(PLUS_MINUS_SCALE.grade(83), "B")
+        self.assertEqual(PLUS_MINUS_SCALE.grade(69.5), "D+")
+        self.assertEqual(PLUS_MINUS_SCALE.grade(59), "F")
+
+    def test_pass_fail_scale(self):
+        self.assertEqual(PASS_FAIL_SCALE(60), "P")
+        self.assertEqual(PASS_FAIL_SCALE(59.9), "F")
+
+    def test_custom_range_and_errors(self):
+        scale = GradingScale([(5, "pass")], lowest="fail", minimum=0, maximum=10)
+        self.assertEqual(scale.grade(5), "pass")
+        self.assertEqual(scale.grade(4.5), "fail")
+        with self.assertRaises(ValueError):
+            scale.grade(11)
+        with self.assertRaises(TypeError):
+            scale.grade("5")
+
+    def test_invalid_cutoffs_raise(self):
+        with self.assertRaises(ValueError):
+            GradingScale([(60, "D"), (60, "C")])
+        with self.assertRaises(ValueError):
+            GradingScale([(120, "A")])
+
+    def test_grading_scale_is_cached(self):
+        cutoffs = ((50, "C"), (75, "B"), (90, "A"))
+        self.assertIs(grading_scale(cutoffs), grading_scale(cutoffs))
+        self.assertEqual(grading_scale(cutoffs).grade(80), "B")
+
+
+class TestGradeStats(unittest.TestCase):
+    def test_add_score_and_percentiles(self):
+        stats = GradeStats()
+        for score in range(101):
+            stats.add_score(score)
+        self.assertEqual(stats.counts, {"F": 60, "D": 10, "C": 10, "B": 10, "A": 11})
+        self.assertAlmostEqual(stats.mean, 50)
+        self.assertEqual(stats.percentile(0), 0)
+        self.assertEqual(stats.percentile(50), 50)
+        self.assertEqual(stats.percentile(90), 90)
+        self.assertEqual(stats.percentile(100), 100)
+
+    def test_add_score_raises_like_assign_grade(self):
+        stats = GradeStats()
+        with self.assertRaises(ValueError):
+            stats.add_score(101)
+        with self.assertRaises(TypeError):
+            stats.add_score("eighty")
+        self.assertEqual(stats.count, 0)
+        with self.assertRaises(ValueError):
+            stats.percentile(50)
+
+    def test_nan_rejected_without_changing_state(self):
+        stats = GradeStats()
+        stats.add_score(80)
+        before = stats.to_dict()
+        with self.assertRaises(TypeError):
+            stats.add_score(float("nan"))
+        self.assertEqual(stats.to_dict(), before)
+        self.assertEqual(stats.percentile(50), 80)
+
+    def test_inf_rejected_without_changing_state(self):
+        unbounded = GradingScale([(90, "A")], maximum=float("inf"))
+        stats = GradeStats()
+        stats.add_score(95, unbounded)
+        before = stats.to_dict()
+        with self.assertRaises(TypeError):
+            stats.add_score(float("inf"), unbounded)
+        with self.assertRaises(TypeError):
+            stats.add(float("-inf"), "F")
+        self.assertEqual(stats.to_dict(), before)
+        self.assertEqual(stats.variance, 0.0)
+
+    def test_merge_matches_single_pass(self):
+        scores = [95, 82.5, 59, 90, 71.25, 64, 100, 0, 33.3]
+        whole = GradeStats()
+        shards = [GradeStats(), GradeStats(), GradeStats()]
+        for i, score in enumerate(scores):
+            whole.add_score(score)
+            shards[i % 3].add_score(score)
+
+        merged = GradeStats().merge(shards[0]).merge(shards[1]).merge(shards[2])
+        self.assertEqual(merged.counts, whole.counts)
+        self.assertEqual(merged.count, whole.count)
+        self.assertAlmostEqual(merged.mean, whole.mean)
+        self.assertAlmostEqual(merged.variance, whole.variance)
+        self.assertEqual((merged.minimum, merged.maximum), (whole.minimum, whole.maximum))
+        self.assertEqual(merged.histogram, whole.histogram)
+
+    def test_serialization_round_trip(self):
+        stats = GradeStats()
+        for score in (88, 91.5, 42):
+            stats.add_score(score)
+        stats.rejected = 2
+        restored = GradeStats.from_dict(json.loads(json.dumps(stats.to_dict())))
+        self.assertEqual(restored.to_dict(), stats.to_dict())
+        self.assertAlmostEqual(restored.variance, stats.variance)
+
+
+class TestGradeCsv(unittest.TestCase):
+    def test_grades_rows_and_collects_stats(self):
+        infile = io.StringIO("name,score\nann,95\nbob,82.5\ncid,59\ndee,90\n")
+        outfile = io.StringIO()
+        stats = grade_csv(infile, outfile)
+        self.assertEqual(outfile.getvalue(),
+                         "name,score,grade\nann,95,A\nbob,82.5,B\ncid,59,F\ndee,90,A\n")
+        self.assertEqual(stats.counts, {"A": 2, "B": 1, "F": 1})
+        self.assertEqual(stats.count, 4)
+        self.assertAlmostEqual(stats.mean, 81.625)
+        self.assertEqual((stats.minimum, stats.maximum), (59, 95))
+        self.assertAlmostEqual(stats.variance, 190.421875)
+
+    def test_invalid_rows_go_to_rejects(self):
+        infile = io.StringIO("name\tscore\nann\teighty\nbob\t105\ncid\t70\ndee\tnan\n")
+        outfile = io.StringIO()
+        rejects = io.StringIO()
+        stats = grade_csv(infile, outfile, rejects, delimiter="\t")
+        self.assertEqual(outfile.getvalue(), "name\tscore\tgrade\ncid\t70\tC\n")
+        self.assertEqual(rejects.getvalue().splitlines(), [
+            "name\tscore\terror",
+            "ann\teighty\tScore must be a number",
+            "bob\t105\tScore must be between 0 and 100 inclusive",
+            "dee\tnan\tScore must be a number",
+        ])
+        self.assertEqual(stats.rejected, 3)
+
+    def test_ragged_rows_go_to_rejects(self):
+        infile = io.StringIO("name,score\nann,95,extra\nbob\ncid,70\n")
+        outfile = io.StringIO()
+        rejects = io.StringIO()
+        stats = grade_csv(infile, outfile, rejects)
+        self.assertEqual(outfile.getvalue(), "name,score,grade\ncid,70,C\n")
+        self.assertEqual(rejects.getvalue().splitlines(), [
+            "name,score,error",
+            "ann,95,Row has more than 2 fields,extra",
+            "bob,,Row has fewer than 2 fields",
+        ])
+        self.assertEqual(stats.rejected, 2)
+
+    def test_existing_output_columns_raise(self):
+        with self.assertRaises(ValueError):
+            grade_csv(io.StringIO("name,score,grade\nann,95,A\n"), io.StringIO())
+        with self.assertRaises(ValueError):
+            grade_csv(io.StringIO("name,score,error\nann,95,\n"), io.StringIO(), io.StringIO())
+        outfile = io.StringIO()
+        grade_csv(io.StringIO("name,score,error\nann,95,\n"), outfile)
+        self.assertEqual(outfile.getvalue(), "name,score,error,grade\nann,95,,A\n")
+
+    def test_missing_score_column_raises(self):
+        with self.assertRaises(ValueError):
+            grade_csv(io.StringIO("name,points\nann,95\n"), io.StringIO())
+
+
+class TestGradeGradebooks(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.paths = []
+        for i, body in enumerate(["ann,95\nbob,x\ncid,70\n", "dee,59.5\neve,105\n", ""]):
+            path = os.path.join(self._tmp.name, f"book{i}.csv")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("name,score\n" + body)
+            self.paths.append(path)
+
+    def test_in_process_and_pool_agree(self):
+        for workers in (1, 2):
+            codes, stats = grade_gradebooks(self.paths, workers)
+            self.assertEqual(codes, [(self.paths[0], b"A-C"), (self.paths[1], b"F-"),
+                                     (self.paths[2], b"")])
+            self.assertEqual(stats.counts, {"A": 1, "C": 1, "F": 1})
+            self.assertEqual(stats.rejected, 2)
+            self.assertAlmostEqual(stats.mean, (95 + 70 + 59.5) / 3)
+
+    def test_blank_lines_skipped_like_grade_csv(self):
+        text = "name,score\nann,95\n\nbob,70\n"
+        path = os.path.join(self._tmp.name, "blank.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        codes, stats = grade_gradebooks([path], 1)
+        self.assertEqual(codes, [(path, b"AC")])
+        self.assertEqual(stats.rejected, grade_csv(io.StringIO(text), io.StringIO()).rejected)
+        self.assertEqual(stats.rejected, 0)
+
+    def test_ragged_rows_rejected_like_grade_csv(self):
+        text = "name,score,x\nann,95\nbob,70,1,2\ncid,80,ok\n"
+        path = os.path.join(self._tmp.name, "ragged.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        codes, stats = grade_gradebooks([path], 1)
+        expected = grade_csv(io.StringIO(text), io.StringIO())
+        self.assertEqual(codes, [(path, b"--B")])
+        self.assertEqual(stats.to_dict(), expected.to_dict())
+
+    def test_missing_score_column_raises(self):
+        path = os.path.join(self._tmp.name, "bad.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("name,points\nann,95\n")
+        with self.assertRaises(ValueError):
+            grade_gradebooks([path], 1)
+
+
+class TestAssignGrades(unittest.TestCase):
+    def test_matches_scalar_assign_grade(self):
+        scores = [i / 4 for i in range(401)] + [float("nan")]
+        expected = "".join(assign_grade(s) for s in scores).encode()
+        self.assertEqual(assign_grades(scores), expected)
+        self.assertEqual(assign_grades(array("d", scores)), expected)
+
+    def test_int_array_and_bytes_buffer(self):
+        self.assertEqual(assign_grades(array("i", [100, 90, 89, 60, 59, 0])), b"AABDFF")
+        self.assertEqual(assign_grades(bytes([100, 80, 70, 0])), b"ABCF")
+
+    def test_non_buffer_iterables(self):
+        from collections import deque
+        self.assertEqual(assign_grades(range(55, 101, 10)), b"FDCBA")
+        self.assertEqual(assign_grades(deque([90, 59.5])), b"AF")
+        self.assertEqual(assign_grades(s for s in (80, 70)), b"BC")
+        with self.assertRaises(ValueError) as ctx:
+            assign_grades(range(99, 103))
+        self.assertEqual(ctx.exception.indices, [2, 3])
+
+    def test_empty_input(self):
+        self.assertEqual(assign_grades([]), b"")
+        self.assertEqual(assign_grades(array("d")), b"")
+
+    def test_out_of_range_reports_indices(self):
+        with self.assertRaises(ValueError) as ctx:
+            assign_grades(array("d", [50, -5, 85, 105]))
+        self.assertEqual(ctx.exception.indices, [1, 3])
+        with self.assertRaises(ValueError) as ctx:
+            assign_grades(bytes([50, 101]))
+        self.assertEqual(ctx.exception.indices, [1])
+
+    def test_non_numeric_reports_indices(self):
+        with self.assertRaises(TypeError) as ctx:
+            assign_grades([85, "eighty", None, 70])
+        self.assertEqual(ctx.exception.indices, [1, 2])
+
+    def test_numpy_array(self):
+        try:
+            import numpy as np
+        except ImportError:
+            self.skipTest("numpy is not installed")
+        scores = np.array([100, 89.9, 79.999, 60, 59.999, float("nan")])
+        self.assertEqual(assign_grades(scores), b"ABCDFF")
+        self.assertEqual(assign_grades(np.arange(0, 101, 10)), b"FFFFFFDCBAA")
+        with self.assertRaises(ValueError) as ctx:
+            assign_grades(np.array([50, -1, 101]))
+        self.assertEqual(ctx.exception.indices, [1, 2])
+        with self.assertRaises(TypeError):
+            assign_grades(np.array(["eighty"]))
+
+
+if __name__ == "__main__":
+    unittest.main()